@@ -13,7 +13,7 @@ from ..constants import DEFAULT_META_DIR
 from ..generation.budget import (
     BudgetBlockedError,
     BudgetEnforcementResult,
-    LLMBudgetConfig,
+    FrozenLLMBudget,
     aggregate_usage_from_events,
     build_budget_event_payload,
     collect_seen_combinations,
@@ -86,7 +86,7 @@ class LLMOrchestrator:
         self.alpha_generator = alpha_generator
         self.meta_dir = Path(meta_dir)
         self.retrieval_budget = load_retrieval_budget(retrieval_budget_config)
-        self.llm_budget: LLMBudgetConfig = load_llm_budget(llm_budget_config)
+        self.llm_budget: FrozenLLMBudget = load_llm_budget(llm_budget_config)
         self.max_idea_regenerations = max(0, int(max_idea_regenerations))
         self.max_alpha_regenerations = max(0, int(max_alpha_regenerations))
 
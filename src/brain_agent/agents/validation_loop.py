@@ -9,7 +9,7 @@ from uuid import uuid4
 
 from ..evaluation.evaluator import Evaluator
 from ..feedback.mutator import FeedbackMutator
-from ..generation.validation_gate import ValidationGate, dump_instruction_json
+from ..generation.validation_gate import ErrorSignature, ValidationGate, dump_instruction_json
 from ..retrieval.pack_builder import (
     RetrievalBudgetConfig,
     RetrievalExpansionPolicy,
@@ -92,7 +92,7 @@ class ValidationLoopOrchestrator:
 
         attempts = 0
         error_codes: list[str] = []
-        signatures: list[str] = []
+        signatures: list[ErrorSignature] = []
         retrieval_expanded = False
 
         self.event_bus.publish(
@@ -113,7 +113,7 @@ class ValidationLoopOrchestrator:
         while True:
             gate_result = self.gate.validate_candidate(working_candidate)
             signature = gate_result.error_signature
-            repeat_count = _repeat_streak(signatures, signature) + (0 if signature == "VALID" else 1)
+            repeat_count = _repeat_streak(signatures, signature) + (1 if signature else 0)
             error_codes = [issue.code for issue in gate_result.issues]
 
             if gate_result.is_valid:
@@ -437,7 +437,7 @@ def _scaled_count(value: Any, factor: float) -> int:
     return scaled
 
 
-def _repeat_streak(history: list[str], signature: str) -> int:
+def _repeat_streak(history: list[ErrorSignature], signature: ErrorSignature) -> int:
     if not signature:
         return 0
     count = 0
@@ -3,6 +3,7 @@
 from .knowledge_pack import build_knowledge_packs
 from .budget import (
     BudgetBlockedError,
+    FrozenLLMBudget,
     LLMBudgetConfig,
     aggregate_usage_from_events,
     build_budget_console_payload,
@@ -15,14 +16,17 @@ from .budget import (
     enforce_alpha_prompt_budget,
     estimate_cost_usd,
     extract_prompt_completion_tokens,
+    freeze_llm_budget,
     load_llm_budget,
     rough_token_estimate,
+    serialize_budget_payload,
 )
 from .openai_provider import (
     LLMCallResult,
     OpenAILLMSettings,
     OpenAIProviderError,
     OpenAIResponsesJSONClient,
+    gather_structured_json,
 )
 from .prompting import (
     ParseFailure,
@@ -42,7 +46,9 @@ __all__ = [
     "OpenAILLMSettings",
     "OpenAIProviderError",
     "OpenAIResponsesJSONClient",
+    "gather_structured_json",
     "BudgetBlockedError",
+    "FrozenLLMBudget",
     "LLMBudgetConfig",
     "aggregate_usage_from_events",
     "build_budget_console_payload",
@@ -55,8 +61,10 @@ __all__ = [
     "enforce_alpha_prompt_budget",
     "estimate_cost_usd",
     "extract_prompt_completion_tokens",
+    "freeze_llm_budget",
     "load_llm_budget",
     "rough_token_estimate",
+    "serialize_budget_payload",
     "ParseFailure",
     "build_alpha_maker_prompt",
     "build_fastexpr_prompt",
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import math
+import operator
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -12,6 +15,8 @@ from typing import Any, Callable, Iterable
 from pydantic import BaseModel, Field, field_validator
 
 from ..retrieval.pack_builder import (
+    LANE_EXPLOIT,
+    LANE_EXPLORE,
     FieldCandidate,
     LaneSelection,
     OperatorCandidate,
@@ -21,6 +26,10 @@ from ..retrieval.pack_builder import (
 )
 from ..schemas import IdeaSpec
 from ..utils.filesystem import utc_now_iso
+from ..utils.json_codec import dumps_bytes
+
+
+FALLBACK_PHASES: tuple[str, ...] = ("fields", "operators", "subcategories")
 
 
 class BudgetBlockedError(RuntimeError):
@@ -67,6 +76,57 @@ class LLMBudgetConfig(BaseModel):
         return exploit / total, explore / total
 
 
+@dataclass(slots=True, frozen=True)
+class FrozenLLMBudget:
+    """Immutable runtime view of LLMBudgetConfig with precomputed hot-path values.
+
+    Pydantic is only used to parse/validate the JSON config; enforcement code
+    reads these plain slots on every fallback step.
+    """
+
+    max_prompt_tokens: int
+    max_completion_tokens: int
+    max_tokens_per_batch: int
+    max_tokens_per_day: int
+    fallback_topk_steps: tuple[float, ...]
+    exploit_ratio: float
+    explore_ratio: float
+    min_explore_candidates_per_batch: int
+    expansion_reserve_tokens: int
+    estimated_cost_per_1k_prompt_tokens: float
+    estimated_cost_per_1k_completion_tokens: float
+    exploit_norm: float
+    explore_norm: float
+    fallback_plan: tuple[tuple[str, float], ...]
+
+    @classmethod
+    def from_model(cls, cfg: LLMBudgetConfig) -> "FrozenLLMBudget":
+        exploit_norm, explore_norm = cfg.normalized_lane_ratio()
+        steps = tuple(float(x) for x in cfg.fallback_topk_steps)
+        return cls(
+            max_prompt_tokens=int(cfg.max_prompt_tokens),
+            max_completion_tokens=int(cfg.max_completion_tokens),
+            max_tokens_per_batch=int(cfg.max_tokens_per_batch),
+            max_tokens_per_day=int(cfg.max_tokens_per_day),
+            fallback_topk_steps=steps,
+            exploit_ratio=float(cfg.exploit_ratio),
+            explore_ratio=float(cfg.explore_ratio),
+            min_explore_candidates_per_batch=int(cfg.min_explore_candidates_per_batch),
+            expansion_reserve_tokens=int(cfg.expansion_reserve_tokens),
+            estimated_cost_per_1k_prompt_tokens=float(cfg.estimated_cost_per_1k_prompt_tokens),
+            estimated_cost_per_1k_completion_tokens=float(cfg.estimated_cost_per_1k_completion_tokens),
+            exploit_norm=exploit_norm,
+            explore_norm=explore_norm,
+            fallback_plan=tuple(itertools.product(FALLBACK_PHASES, steps)),
+        )
+
+    def normalized_lane_ratio(self) -> tuple[float, float]:
+        return self.exploit_norm, self.explore_norm
+
+
+BudgetLike = LLMBudgetConfig | FrozenLLMBudget
+
+
 @dataclass
 class UsageSnapshot:
     run_prompt_tokens: int = 0
@@ -113,17 +173,24 @@ class BudgetEnforcementResult:
     fallback_steps: list[dict[str, Any]] = field(default_factory=list)
 
 
-def load_llm_budget(path: str | Path | None = None) -> LLMBudgetConfig:
+def load_llm_budget(path: str | Path | None = None) -> FrozenLLMBudget:
     """Load LLM budget config from JSON; fall back to defaults when missing."""
     if path is None:
-        return LLMBudgetConfig()
+        return FrozenLLMBudget.from_model(LLMBudgetConfig())
 
     p = Path(path)
     if not p.exists():
-        return LLMBudgetConfig()
+        return FrozenLLMBudget.from_model(LLMBudgetConfig())
 
     payload = json.loads(p.read_text(encoding="utf-8"))
-    return LLMBudgetConfig.model_validate(payload)
+    return FrozenLLMBudget.from_model(LLMBudgetConfig.model_validate(payload))
+
+
+def freeze_llm_budget(budget: BudgetLike) -> FrozenLLMBudget:
+    """Return the runtime budget view, converting a pydantic config once."""
+    if isinstance(budget, FrozenLLMBudget):
+        return budget
+    return FrozenLLMBudget.from_model(budget)
 
 
 def rough_token_estimate(text_or_chars: str | int | None) -> int:
@@ -134,10 +201,10 @@ def rough_token_estimate(text_or_chars: str | int | None) -> int:
         chars = max(0, int(text_or_chars))
     else:
         chars = len(str(text_or_chars))
-    return max(0, int(math.ceil(chars / 4.0)))
+    return (chars + 3) // 4
 
 
-def estimate_cost_usd(prompt_tokens: int, completion_tokens: int, budget: LLMBudgetConfig) -> float:
+def estimate_cost_usd(prompt_tokens: int, completion_tokens: int, budget: BudgetLike) -> float:
     prompt_cost = (max(0, prompt_tokens) / 1000.0) * max(0.0, float(budget.estimated_cost_per_1k_prompt_tokens))
     completion_cost = (max(0, completion_tokens) / 1000.0) * max(
         0.0,
@@ -235,7 +302,7 @@ def can_use_expansion_reserve(
     *,
     repeated_error_count: int,
     estimated_extra_prompt_tokens: int,
-    budget: LLMBudgetConfig,
+    budget: BudgetLike,
     trigger_threshold: int = 2,
 ) -> bool:
     """Return whether reserved expansion budget can be used for repeated errors."""
@@ -351,13 +418,14 @@ def enforce_alpha_prompt_budget(
     idea: IdeaSpec,
     retrieval_pack: RetrievalPack,
     knowledge_bundle: dict[str, Any],
-    budget: LLMBudgetConfig,
+    budget: BudgetLike,
     usage: UsageSnapshot,
     seen_combo_keys: set[str],
     prompt_builder: Callable[[IdeaSpec, RetrievalPack, dict[str, Any]], str],
     max_output_tokens: int,
 ) -> BudgetEnforcementResult:
     """Apply request/batch/day budget checks with staged Top-K fallback."""
+    budget = freeze_llm_budget(budget)
     working_pack = retrieval_pack.model_copy(deep=True)
     explore_floor_targets = _explore_floor_targets(retrieval_pack, budget)
     _sync_pack_contracts(working_pack, budget)
@@ -384,50 +452,57 @@ def enforce_alpha_prompt_budget(
         )
 
     fallback_steps: list[dict[str, Any]] = []
-    for phase in ("fields", "operators", "subcategories"):
-        for factor in budget.fallback_topk_steps:
-            signature_before = _pack_signature(working_pack)
-            _shrink_pack(working_pack, phase=phase, factor=factor, budget=budget)
-            _sync_pack_contracts(working_pack, budget)
-            signature_after = _pack_signature(working_pack)
-
-            if signature_after == signature_before:
-                continue
+    # The pack only changes inside shrink/sync, so the signature computed after
+    # one step is the "before" signature of the next step.
+    signature = _pack_signature(working_pack)
+    for phase, factor in budget.fallback_plan:
+        dataset_count = len(working_pack.candidate_datasets)
+        _shrink_pack(working_pack, phase=phase, factor=factor, budget=budget)
+        # Shrinking only ever drops rows, so equal counts/signature mean the
+        # step was a no-op and the pack is still in its synced state.
+        if len(working_pack.candidate_datasets) == dataset_count and _pack_signature(working_pack) == signature:
+            continue
+        _sync_pack_contracts(working_pack, budget)
+        signature_after = _pack_signature(working_pack)
 
-            fallback_count += 1
-            prompt = prompt_builder(idea, working_pack, knowledge_bundle)
-            evaluation = _evaluate_budget(
-                prompt=prompt,
+        if signature_after == signature:
+            continue
+        signature = signature_after
+
+        fallback_count += 1
+        prompt = prompt_builder(idea, working_pack, knowledge_bundle)
+        evaluation = _evaluate_budget(
+            prompt=prompt,
+            pack=working_pack,
+            budget=budget,
+            usage=usage,
+            seen_combo_keys=seen_combo_keys,
+            max_output_tokens=max_output_tokens,
+            fallback_count=fallback_count,
+            explore_floor_targets=explore_floor_targets,
+        )
+        fallback_steps.append(
+            {
+                "phase": phase,
+                "factor": round(factor, 4),
+                "prompt_tokens": evaluation.prompt_tokens_rough,
+                "completion_tokens": evaluation.completion_tokens_budget,
+                "selected_topk": evaluation.selected_topk,
+                "budget_exceeded": evaluation.exceeded,
+                "fallback_count": fallback_count,
+            }
+        )
+
+        if evaluation.passed:
+            return BudgetEnforcementResult(
+                allowed=True,
                 pack=working_pack,
-                budget=budget,
+                prompt=prompt,
+                evaluation=evaluation,
                 usage=usage,
-                seen_combo_keys=seen_combo_keys,
-                max_output_tokens=max_output_tokens,
-                fallback_count=fallback_count,
-                explore_floor_targets=explore_floor_targets,
-            )
-            fallback_steps.append(
-                {
-                    "phase": phase,
-                    "factor": round(float(factor), 4),
-                    "prompt_tokens": evaluation.prompt_tokens_rough,
-                    "completion_tokens": evaluation.completion_tokens_budget,
-                    "selected_topk": evaluation.selected_topk,
-                    "budget_exceeded": evaluation.exceeded,
-                    "fallback_count": fallback_count,
-                }
+                fallback_steps=fallback_steps,
             )
 
-            if evaluation.passed:
-                return BudgetEnforcementResult(
-                    allowed=True,
-                    pack=working_pack,
-                    prompt=prompt,
-                    evaluation=evaluation,
-                    usage=usage,
-                    fallback_steps=fallback_steps,
-                )
-
     return BudgetEnforcementResult(
         allowed=False,
         pack=working_pack,
@@ -441,7 +516,7 @@ def enforce_alpha_prompt_budget(
 def build_budget_event_payload(
     *,
     step_name: str,
-    budget: LLMBudgetConfig,
+    budget: BudgetLike,
     usage: UsageSnapshot,
     evaluation: BudgetEvaluation,
     extra: dict[str, Any] | None = None,
@@ -477,12 +552,17 @@ def build_budget_event_payload(
     return payload
 
 
+def serialize_budget_payload(payload: dict[str, Any] | list[dict[str, Any]]) -> bytes:
+    """Serialize one budget.* payload (or a whole telemetry batch) to JSON bytes."""
+    return dumps_bytes(payload)
+
+
 def build_budget_console_payload(
     *,
     run_id: str,
     run_events: list[dict[str, Any]],
     all_events: list[dict[str, Any]],
-    budget: LLMBudgetConfig,
+    budget: BudgetLike,
 ) -> dict[str, Any]:
     """Build chart-friendly payload for Budget Console endpoint."""
     usage = aggregate_usage_from_events(all_events, run_id=run_id)
@@ -501,11 +581,8 @@ def build_budget_console_payload(
         "explore_floor_breached": False,
     }
 
-    for event in run_events:
+    for event in _budget_events(run_events):
         event_type = str(event.get("event_type") or "")
-        if not event_type.startswith("budget."):
-            continue
-
         detail = event.get("payload")
         payload = detail if isinstance(detail, dict) else {}
         ts = str(event.get("created_at") or "")
@@ -578,7 +655,7 @@ def build_kpi_payload(
     *,
     run_id: str,
     run_events: list[dict[str, Any]],
-    budget: LLMBudgetConfig,
+    budget: BudgetLike,
 ) -> dict[str, Any]:
     """Build coverage/novelty/explore KPI payload for dashboard endpoint."""
     coverage_series: list[dict[str, Any]] = []
@@ -589,11 +666,7 @@ def build_kpi_payload(
     latest_novelty = 0.0
     latest_explore_ratio = 0.0
 
-    for event in run_events:
-        event_type = str(event.get("event_type") or "")
-        if not event_type.startswith("budget."):
-            continue
-
+    for event in _budget_events(run_events):
         detail = event.get("payload")
         payload = detail if isinstance(detail, dict) else {}
         ts = str(event.get("created_at") or "")
@@ -640,18 +713,19 @@ def build_reactor_status_payload(
     run_id: str,
     run_events: list[dict[str, Any]],
     all_events: list[dict[str, Any]],
-    budget: LLMBudgetConfig,
+    budget: BudgetLike,
 ) -> dict[str, Any]:
     """Build step-20 Reactor Core HUD payload (REST/WS friendly)."""
+    budget_events = _budget_events(run_events)
     budget_payload = build_budget_console_payload(
         run_id=run_id,
-        run_events=run_events,
+        run_events=budget_events,
         all_events=all_events,
         budget=budget,
     )
     kpi_payload = build_kpi_payload(
         run_id=run_id,
-        run_events=run_events,
+        run_events=budget_events,
         budget=budget,
     )
 
@@ -748,7 +822,7 @@ def build_reactor_status_payload(
     explore_info = lane_map.get("explore_ratio") if isinstance(lane_map.get("explore_ratio"), dict) else {}
     explore_ratio = _to_float(explore_info.get("value"))
     if explore_ratio <= 0:
-        latest_lane_ratio = _latest_lane_ratio(run_events)
+        latest_lane_ratio = _latest_lane_ratio(budget_events)
         explore_ratio = _to_float(latest_lane_ratio.get("explore_ratio"))
     exploit_ratio = max(0.0, min(1.0, 1.0 - explore_ratio))
 
@@ -846,7 +920,7 @@ def _evaluate_budget(
     *,
     prompt: str,
     pack: RetrievalPack,
-    budget: LLMBudgetConfig,
+    budget: FrozenLLMBudget,
     usage: UsageSnapshot,
     seen_combo_keys: set[str],
     max_output_tokens: int,
@@ -854,7 +928,7 @@ def _evaluate_budget(
     explore_floor_targets: tuple[int, int],
 ) -> BudgetEvaluation:
     prompt_tokens = rough_token_estimate(prompt)
-    completion_budget = max(1, min(int(max_output_tokens), int(budget.max_completion_tokens)))
+    completion_budget = max(1, min(int(max_output_tokens), budget.max_completion_tokens))
 
     projected_batch = usage.total_run_tokens + prompt_tokens + completion_budget
     projected_day = usage.total_day_tokens + prompt_tokens + completion_budget
@@ -868,13 +942,17 @@ def _evaluate_budget(
     lane_ratio = _lane_ratio(pack)
     coverage_kpi = float(len(set(pack.selected_subcategories)))
     novelty_kpi, combo_sample = _novelty_kpi(pack, seen_combo_keys)
-    explore_floor = _explore_floor_preserved(pack, explore_floor_targets)
+    # _lane_ratio already counted the explore rows; reuse them for the floor check.
+    explore_floor = _explore_floor_preserved(
+        (lane_ratio["fields"]["explore"], lane_ratio["operators"]["explore"]),
+        explore_floor_targets,
+    )
 
     exceeded = {
-        "request_prompt": prompt_tokens > int(budget.max_prompt_tokens),
-        "request_completion": completion_budget > int(budget.max_completion_tokens),
-        "batch_total": projected_batch > int(budget.max_tokens_per_batch),
-        "day_total": projected_day > int(budget.max_tokens_per_day),
+        "request_prompt": prompt_tokens > budget.max_prompt_tokens,
+        "request_completion": completion_budget > budget.max_completion_tokens,
+        "batch_total": projected_batch > budget.max_tokens_per_batch,
+        "day_total": projected_day > budget.max_tokens_per_day,
         "explore_floor": not explore_floor,
     }
 
@@ -899,7 +977,7 @@ def _evaluate_budget(
     )
 
 
-def _shrink_pack(pack: RetrievalPack, *, phase: str, factor: float, budget: LLMBudgetConfig) -> None:
+def _shrink_pack(pack: RetrievalPack, *, phase: str, factor: float, budget: FrozenLLMBudget) -> None:
     if phase == "fields":
         _shrink_fields(pack, factor=factor, budget=budget)
         return
@@ -911,7 +989,7 @@ def _shrink_pack(pack: RetrievalPack, *, phase: str, factor: float, budget: LLMB
         return
 
 
-def _shrink_fields(pack: RetrievalPack, *, factor: float, budget: LLMBudgetConfig) -> None:
+def _shrink_fields(pack: RetrievalPack, *, factor: float, budget: FrozenLLMBudget) -> None:
     current = list(pack.candidate_fields)
     if len(current) <= 1:
         return
@@ -920,7 +998,7 @@ def _shrink_fields(pack: RetrievalPack, *, factor: float, budget: LLMBudgetConfi
     pack.candidate_fields = _trim_field_candidates(current, target_total=target_total, budget=budget)
 
 
-def _shrink_operators(pack: RetrievalPack, *, factor: float, budget: LLMBudgetConfig) -> None:
+def _shrink_operators(pack: RetrievalPack, *, factor: float, budget: FrozenLLMBudget) -> None:
     current = list(pack.candidate_operators)
     if len(current) <= 1:
         return
@@ -929,40 +1007,41 @@ def _shrink_operators(pack: RetrievalPack, *, factor: float, budget: LLMBudgetCo
     pack.candidate_operators = _trim_operator_candidates(current, target_total=target_total, budget=budget)
 
 
-def _shrink_subcategories(pack: RetrievalPack, *, factor: float, budget: LLMBudgetConfig) -> None:
+def _shrink_subcategories(pack: RetrievalPack, *, factor: float, budget: FrozenLLMBudget) -> None:
     if len(pack.selected_subcategories) <= 1:
         return
 
     target_total = _target_total(len(pack.selected_subcategories), factor, min_total=1)
 
     exploit_subcats = _ordered_unique(
-        [row.subcategory_id for row in pack.candidate_datasets if row.lane == "exploit" and row.subcategory_id]
+        row.subcategory_id for row in pack.candidate_datasets if row.lane == LANE_EXPLOIT and row.subcategory_id
     )
     explore_subcats = _ordered_unique(
-        [row.subcategory_id for row in pack.candidate_datasets if row.lane == "explore" and row.subcategory_id]
+        row.subcategory_id for row in pack.candidate_datasets if row.lane == LANE_EXPLORE and row.subcategory_id
     )
 
     exploit_target, explore_target = _allocate_lane_counts(
         target_total=target_total,
         exploit_available=len(exploit_subcats),
         explore_available=len(explore_subcats),
-        explore_ratio=budget.normalized_lane_ratio()[1],
+        explore_ratio=budget.explore_norm,
         min_explore=1 if budget.min_explore_candidates_per_batch > 0 else 0,
     )
 
     keep: list[str] = []
     keep.extend(exploit_subcats[:exploit_target])
     keep.extend(explore_subcats[:explore_target])
+    keep_set = set(keep)
 
     if len(keep) < target_total:
         for subcat in pack.selected_subcategories:
-            if subcat in keep:
+            if subcat in keep_set:
                 continue
             keep.append(subcat)
+            keep_set.add(subcat)
             if len(keep) >= target_total:
                 break
 
-    keep_set = set(keep)
     pack.selected_subcategories = [item for item in pack.selected_subcategories if item in keep_set]
 
     pack.candidate_datasets = [row for row in pack.candidate_datasets if row.subcategory_id in keep_set]
@@ -975,19 +1054,19 @@ def _trim_field_candidates(
     rows: list[FieldCandidate],
     *,
     target_total: int,
-    budget: LLMBudgetConfig,
+    budget: FrozenLLMBudget,
 ) -> list[FieldCandidate]:
     if target_total >= len(rows):
         return rows
 
-    exploit = [row for row in rows if row.lane == "exploit"]
-    explore = [row for row in rows if row.lane == "explore"]
+    exploit = [row for row in rows if row.lane == LANE_EXPLOIT]
+    explore = [row for row in rows if row.lane == LANE_EXPLORE]
 
     exploit_target, explore_target = _allocate_lane_counts(
         target_total=target_total,
         exploit_available=len(exploit),
         explore_available=len(explore),
-        explore_ratio=budget.normalized_lane_ratio()[1],
+        explore_ratio=budget.explore_norm,
         min_explore=min(budget.min_explore_candidates_per_batch, target_total),
     )
 
@@ -996,10 +1075,10 @@ def _trim_field_candidates(
 
     out: list[FieldCandidate] = []
     for row in rows:
-        if row.lane == "exploit" and row.id in keep_exploit:
+        if row.lane == LANE_EXPLOIT and row.id in keep_exploit:
             out.append(row)
             keep_exploit.discard(row.id)
-        elif row.lane == "explore" and row.id in keep_explore:
+        elif row.lane == LANE_EXPLORE and row.id in keep_explore:
             out.append(row)
             keep_explore.discard(row.id)
         if len(out) >= target_total:
@@ -1011,19 +1090,19 @@ def _trim_operator_candidates(
     rows: list[OperatorCandidate],
     *,
     target_total: int,
-    budget: LLMBudgetConfig,
+    budget: FrozenLLMBudget,
 ) -> list[OperatorCandidate]:
     if target_total >= len(rows):
         return rows
 
-    exploit = [row for row in rows if row.lane == "exploit"]
-    explore = [row for row in rows if row.lane == "explore"]
+    exploit = [row for row in rows if row.lane == LANE_EXPLOIT]
+    explore = [row for row in rows if row.lane == LANE_EXPLORE]
 
     exploit_target, explore_target = _allocate_lane_counts(
         target_total=target_total,
         exploit_available=len(exploit),
         explore_available=len(explore),
-        explore_ratio=budget.normalized_lane_ratio()[1],
+        explore_ratio=budget.explore_norm,
         min_explore=min(budget.min_explore_candidates_per_batch, target_total),
     )
 
@@ -1032,10 +1111,10 @@ def _trim_operator_candidates(
 
     out: list[OperatorCandidate] = []
     for row in rows:
-        if row.lane == "exploit" and row.name in keep_exploit:
+        if row.lane == LANE_EXPLOIT and row.name in keep_exploit:
             out.append(row)
             keep_exploit.discard(row.name)
-        elif row.lane == "explore" and row.name in keep_explore:
+        elif row.lane == LANE_EXPLORE and row.name in keep_explore:
             out.append(row)
             keep_explore.discard(row.name)
         if len(out) >= target_total:
@@ -1043,22 +1122,38 @@ def _trim_operator_candidates(
     return out
 
 
-def _sync_pack_contracts(pack: RetrievalPack, budget: LLMBudgetConfig) -> None:
-    exploit_fields = [row.id for row in pack.candidate_fields if row.lane == "exploit"]
-    explore_fields = [row.id for row in pack.candidate_fields if row.lane == "explore"]
-    exploit_ops = [row.name for row in pack.candidate_operators if row.lane == "exploit"]
-    explore_ops = [row.name for row in pack.candidate_operators if row.lane == "explore"]
+_lane_and_id = operator.attrgetter("lane", "id")
+_lane_and_name = operator.attrgetter("lane", "name")
+
+
+def _sync_pack_contracts(pack: RetrievalPack, budget: FrozenLLMBudget) -> None:
+    exploit_fields: list[str] = []
+    explore_fields: list[str] = []
+    exploit_field_append, explore_field_append = exploit_fields.append, explore_fields.append
+    for lane, field_id in map(_lane_and_id, pack.candidate_fields):
+        (exploit_field_append if lane == LANE_EXPLOIT else explore_field_append)(field_id)
+
+    exploit_ops: list[str] = []
+    explore_ops: list[str] = []
+    exploit_op_append, explore_op_append = exploit_ops.append, explore_ops.append
+    for lane, op_name in map(_lane_and_name, pack.candidate_operators):
+        (exploit_op_append if lane == LANE_EXPLOIT else explore_op_append)(op_name)
 
     pack.lanes = {
         "exploit": LaneSelection(field_ids=exploit_fields, operator_names=exploit_ops),
         "explore": LaneSelection(field_ids=explore_fields, operator_names=explore_ops),
     }
 
-    dataset_subcats = _ordered_unique([row.subcategory_id for row in pack.candidate_datasets if row.subcategory_id])
+    dataset_subcats = _ordered_unique(row.subcategory_id for row in pack.candidate_datasets if row.subcategory_id)
     if dataset_subcats:
-        preferred = [value for value in pack.selected_subcategories if value in set(dataset_subcats)]
-        extras = [value for value in dataset_subcats if value not in set(preferred)]
-        pack.selected_subcategories = preferred + extras
+        # Keep selected subcategories that still have datasets (in their order),
+        # then append the remaining dataset subcategories; fromkeys dedupes.
+        dataset_subcat_set = set(dataset_subcats)
+        pack.selected_subcategories = list(
+            dict.fromkeys(
+                [value for value in pack.selected_subcategories if value in dataset_subcat_set] + dataset_subcats
+            )
+        )
 
     counts = {
         "subcategories": len(pack.selected_subcategories),
@@ -1071,32 +1166,37 @@ def _sync_pack_contracts(pack: RetrievalPack, budget: LLMBudgetConfig) -> None:
         candidate_counts=counts,
     )
 
-    payload = {
+    # Same count as len(json.dumps(payload, ensure_ascii=False)) over the full
+    # pack payload, without re-encoding every row: the envelope is encoded
+    # with empty row lists and each list adds its cached row lengths plus the
+    # ", " separators between rows.
+    envelope = {
         "query": pack.query,
         "selected_subcategories": pack.selected_subcategories,
-        "candidate_datasets": [row.model_dump(mode="python") for row in pack.candidate_datasets],
-        "candidate_fields": [row.model_dump(mode="python") for row in pack.candidate_fields],
-        "candidate_operators": [row.model_dump(mode="python") for row in pack.candidate_operators],
-        "lanes": {key: lane.model_dump(mode="python") for key, lane in pack.lanes.items()},
+        "candidate_datasets": [],
+        "candidate_fields": [],
+        "candidate_operators": [],
+        "lanes": {key: lane.cached_dump for key, lane in pack.lanes.items()},
     }
-    chars = len(json.dumps(payload, ensure_ascii=False))
+    chars = len(json.dumps(envelope, ensure_ascii=False))
+    for rows in (pack.candidate_datasets, pack.candidate_fields, pack.candidate_operators):
+        if rows:
+            chars += sum(row.cached_json_len for row in rows) + 2 * (len(rows) - 1)
     pack.token_estimate = RetrievalTokenEstimate(
         input_chars=chars,
         input_tokens_rough=rough_token_estimate(chars),
     )
 
-    max_items = dict(pack.context_guard.max_items or {})
-    max_items.update(counts)
-    pack.context_guard.max_items = max_items
-
-    policy = dict(pack.budget_policy or {})
-    policy["llm_budget"] = {
-        "max_prompt_tokens": budget.max_prompt_tokens,
-        "max_completion_tokens": budget.max_completion_tokens,
-        "max_tokens_per_batch": budget.max_tokens_per_batch,
-        "max_tokens_per_day": budget.max_tokens_per_day,
+    pack.context_guard.max_items = {**(pack.context_guard.max_items or {}), **counts}
+    pack.budget_policy = {
+        **(pack.budget_policy or {}),
+        "llm_budget": {
+            "max_prompt_tokens": budget.max_prompt_tokens,
+            "max_completion_tokens": budget.max_completion_tokens,
+            "max_tokens_per_batch": budget.max_tokens_per_batch,
+            "max_tokens_per_day": budget.max_tokens_per_day,
+        },
     }
-    pack.budget_policy = policy
 
 
 def _pack_signature(pack: RetrievalPack) -> tuple[Any, ...]:
@@ -1110,10 +1210,8 @@ def _pack_signature(pack: RetrievalPack) -> tuple[Any, ...]:
 def _target_total(current_total: int, factor: float, *, min_total: int) -> int:
     if current_total <= min_total:
         return current_total
-    target = max(min_total, int(math.floor(current_total * float(factor))))
-    if target >= current_total:
-        return max(min_total, current_total - 1)
-    return target
+    # Always shrink by at least one item, never below min_total.
+    return max(min_total, min(current_total - 1, math.floor(current_total * factor)))
 
 
 def _allocate_lane_counts(
@@ -1144,23 +1242,24 @@ def _allocate_lane_counts(
         exploit_target = 1
         explore_target = max(0, target_total - exploit_target)
 
-    while exploit_target + explore_target < target_total:
-        if exploit_target < exploit_available:
-            exploit_target += 1
-            continue
-        if explore_target < explore_available:
-            explore_target += 1
-            continue
-        break
+    # Fill any remaining slots from exploit first, then explore (closed form).
+    deficit = target_total - exploit_target - explore_target
+    if deficit > 0:
+        add_exploit = min(deficit, max(0, exploit_available - exploit_target))
+        exploit_target += add_exploit
+        explore_target += min(deficit - add_exploit, max(0, explore_available - explore_target))
 
     return exploit_target, explore_target
 
 
 def _lane_ratio(pack: RetrievalPack) -> dict[str, Any]:
-    exploit_fields = sum(1 for row in pack.candidate_fields if row.lane == "exploit")
-    explore_fields = sum(1 for row in pack.candidate_fields if row.lane == "explore")
-    exploit_ops = sum(1 for row in pack.candidate_operators if row.lane == "exploit")
-    explore_ops = sum(1 for row in pack.candidate_operators if row.lane == "explore")
+    field_lanes = Counter(row.lane for row in pack.candidate_fields)
+    op_lanes = Counter(row.lane for row in pack.candidate_operators)
+    # Anything that is not exploit is counted as explore.
+    exploit_fields = field_lanes[LANE_EXPLOIT]
+    explore_fields = len(pack.candidate_fields) - exploit_fields
+    exploit_ops = op_lanes[LANE_EXPLOIT]
+    explore_ops = len(pack.candidate_operators) - exploit_ops
 
     exploit_total = exploit_fields + exploit_ops
     explore_total = explore_fields + explore_ops
@@ -1183,48 +1282,48 @@ def _lane_ratio(pack: RetrievalPack) -> dict[str, Any]:
 
 
 def _novelty_kpi(pack: RetrievalPack, seen_combo_keys: set[str]) -> tuple[float, list[str]]:
-    field_ids = [row.id for row in pack.candidate_fields[: min(20, len(pack.candidate_fields))]]
-    operator_names = [row.name for row in pack.candidate_operators[: min(20, len(pack.candidate_operators))]]
+    # Dedupe the (at most 20) ids/names up front so the cross product is
+    # already unique and no combo-length dedupe pass is needed.
+    field_ids = list(dict.fromkeys(row.id for row in pack.candidate_fields[:20]))
+    operator_names = list(dict.fromkeys(row.name for row in pack.candidate_operators[:20]))
 
-    combos = [f"{field_id}::{op_name}" for field_id in field_ids for op_name in operator_names]
+    combos = [f"{field_id}::{op_name}" for field_id, op_name in itertools.product(field_ids, operator_names)]
     if not combos:
         return 0.0, []
 
-    unique_combos = _ordered_unique(combos)
-    seen = set(seen_combo_keys)
-    new_count = len([key for key in unique_combos if key not in seen])
-    novelty = new_count / max(1, len(unique_combos))
+    new_count = len(combos) - len(seen_combo_keys.intersection(combos))
+    novelty = new_count / len(combos)
 
-    return round(float(novelty), 4), unique_combos[:64]
+    return round(float(novelty), 4), combos[:64]
 
 
-def _explore_floor_targets(pack: RetrievalPack, budget: LLMBudgetConfig) -> tuple[int, int]:
-    floor = max(0, int(budget.min_explore_candidates_per_batch))
+def _explore_floor_targets(pack: RetrievalPack, budget: FrozenLLMBudget) -> tuple[int, int]:
+    floor = max(0, budget.min_explore_candidates_per_batch)
     if floor <= 0:
         return 0, 0
 
-    explore_fields = sum(1 for row in pack.candidate_fields if row.lane == "explore")
-    explore_ops = sum(1 for row in pack.candidate_operators if row.lane == "explore")
+    explore_fields, explore_ops = _explore_counts(pack)
     return min(floor, explore_fields), min(floor, explore_ops)
 
 
-def _explore_floor_preserved(pack: RetrievalPack, targets: tuple[int, int]) -> bool:
+def _explore_floor_preserved(explore_counts: tuple[int, int], targets: tuple[int, int]) -> bool:
+    explore_fields, explore_ops = explore_counts
     field_target, op_target = targets
-    explore_fields = sum(1 for row in pack.candidate_fields if row.lane == "explore")
-    explore_ops = sum(1 for row in pack.candidate_operators if row.lane == "explore")
     return explore_fields >= max(0, field_target) and explore_ops >= max(0, op_target)
 
 
-def _ordered_unique(values: list[str]) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-    for value in values:
-        key = str(value)
-        if not key or key in seen:
-            continue
-        seen.add(key)
-        out.append(key)
-    return out
+def _explore_counts(pack: RetrievalPack) -> tuple[int, int]:
+    explore_fields = Counter(row.lane for row in pack.candidate_fields)[LANE_EXPLORE]
+    explore_ops = Counter(row.lane for row in pack.candidate_operators)[LANE_EXPLORE]
+    return explore_fields, explore_ops
+
+
+def _ordered_unique(values: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(filter(None, map(str, values))))
+
+
+def _budget_events(events: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [event for event in events if str(event.get("event_type") or "").startswith("budget.")]
 
 
 def _first_nonneg_int(payload: dict[str, Any], keys: tuple[str, ...]) -> int:
@@ -1232,16 +1331,28 @@ def _first_nonneg_int(payload: dict[str, Any], keys: tuple[str, ...]) -> int:
         value = payload.get(key)
         if value is None:
             continue
-        try:
-            out = int(value)
-            if out >= 0:
-                return out
-        except Exception:
-            continue
+        # Usage payloads almost always carry plain ints; only other types pay
+        # for the guarded conversion.
+        out = value if type(value) is int else _coerce_int(value)
+        if out is not None and out >= 0:
+            return out
     return -1
 
 
+def _coerce_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except Exception:
+        return None
+
+
 def _to_int(value: Any) -> int:
+    # Event payloads mostly hold plain ints or missing keys; skip the
+    # exception path (raised for None) in both cases.
+    if type(value) is int:
+        return value
+    if value is None:
+        return 0
     try:
         return int(value)
     except Exception:
@@ -1249,6 +1360,10 @@ def _to_int(value: Any) -> int:
 
 
 def _to_float(value: Any) -> float:
+    if type(value) is float:
+        return value
+    if value is None:
+        return 0.0
     try:
         return float(value)
     except Exception:
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal, TypeVar
 
 from pydantic import BaseModel, Field
 
 from ..constants import DEFAULT_META_DIR
+from ..schemas import ValidationReport
 from ..storage.sqlite_store import MetadataStore
-from ..utils.filesystem import utc_now_iso, write_json
+from ..utils.filesystem import utc_now_iso, write_bytes
+from ..utils.json_codec import dumps_bytes, loads as json_loads
 from ..validation.static_validator import (
+    ALLOWED_CHAR_RE,
     VALIDATION_ERROR_TAXONOMY,
     StaticValidator,
     classify_validation_error,
@@ -107,6 +115,95 @@ class KnowledgePackBuildResult(BaseModel):
         return len(self.failed_parts) == 0
 
 
+_SIMPLE_CHOICE_TYPES = frozenset({str, int, bool, type(None)})
+
+
+# Marker -> tags for _rule_tags_for_expression. ts_decay_linear( also counts
+# as a ts_ hit because the lookahead scan reports one marker per position.
+_RULE_TAG_MARKERS: dict[str, tuple[str, ...]] = {
+    "ts_decay_linear(": ("timeseries-window", "turnover-control"),
+    "ts_": ("timeseries-window",),
+    "group_": ("group-neutralization",),
+    "vec_": ("vector-aggregated",),
+    "rank(": ("cross-sectional-normalization",),
+    "zscore(": ("cross-sectional-normalization",),
+    "trade_when(": ("conditional-logic",),
+    "if_else(": ("conditional-logic",),
+    "hump(": ("turnover-control",),
+    "bucket(": ("group-bucketing",),
+}
+_RULE_TAG_MARKER_RE = re.compile("(?=(" + "|".join(re.escape(marker) for marker in _RULE_TAG_MARKERS) + "))")
+_RULE_TAG_ORDER = (
+    "timeseries-window",
+    "group-neutralization",
+    "vector-aggregated",
+    "cross-sectional-normalization",
+    "conditional-logic",
+    "turnover-control",
+    "group-bucketing",
+)
+
+
+# Visual card styles keyed by normalized operator category (read-only).
+_DISPLAY_STYLES: dict[str, dict[str, str]] = {
+    "time series": {"group": "timeseries", "badge_color": "cyan", "complexity": "medium"},
+    "cross sectional": {"group": "cross_sectional", "badge_color": "amber", "complexity": "low"},
+    "group": {"group": "group_ops", "badge_color": "orange", "complexity": "medium"},
+    "transform": {"group": "transform", "badge_color": "blue", "complexity": "low"},
+    "vector": {"group": "vector_ops", "badge_color": "green", "complexity": "medium"},
+    "logical": {"group": "logical", "badge_color": "rose", "complexity": "medium"},
+}
+_DISPLAY_STYLE_DEFAULT: dict[str, str] = {"group": "misc", "badge_color": "slate", "complexity": "medium"}
+
+
+# Operator tips for visual cards; shared lists, treat as read-only.
+_TIPS_TIMESERIES_OP = [
+    "MATRIX 필드와 lookback(d) 인자를 함께 사용",
+    "결측치가 많은 필드는 ts_backfill 후 결합 검토",
+]
+_TIPS_GROUP = [
+    "GROUP + MATRIX 조합을 맞춰야 타입 위반을 피함",
+    "GROUP 필드가 없으면 bucket(rank(cap)) 패턴 고려",
+]
+_TIPS_VECTOR = [
+    "VECTOR 필드는 vec_ 계열로 집계 후 후속 연산에 전달",
+    "vec_ 결과를 rank/zscore와 조합해 스케일 안정화",
+]
+_TIPS_NORMALIZATION = [
+    "동일 단계에서 중복 정규화를 과도하게 쌓지 않기",
+    "단위가 다른 필드 결합 전 정규화 우선 적용",
+]
+_TIPS_CONDITIONAL = [
+    "조건식 중첩을 최소화해 디버깅 가능성 유지",
+    "entry/exit 조건의 의미를 generation_notes에 남기기",
+]
+_TIPS_TURNOVER = [
+    "turnover 제어 연산은 신호 생성 이후 후단에 배치",
+    "감쇠 강도가 높을수록 반응성이 낮아질 수 있음",
+]
+_TIPS_TIMESERIES_CATEGORY = [
+    "시계열 lookback은 신호 시간축과 일치시킬 것",
+    "이상치/결측이 많은 경우 robust 연산자 우선 고려",
+]
+_TIPS_DEFAULT = [
+    "operators metadata의 signature/scope를 우선 준수",
+    "retrieval pack 후보 내 field/operator만 조합",
+]
+
+
+# Visual-pack view of the validator error taxonomy (read-only).
+_ERROR_TAXONOMY_VIEW: list[dict[str, str]] = [
+    {
+        "error_key": row["error_key"],
+        "match_pattern": row["match_pattern"],
+        "severity": row["severity"],
+        "fix_hint": row["fix_hint"],
+    }
+    for row in VALIDATION_ERROR_TAXONOMY
+]
+_EXAMPLE_QUALITY_FLAGS: dict[str, bool] = {"validation_passed": True, "counterexample": False}
+
+
 def build_knowledge_packs(
     *,
     store: MetadataStore,
@@ -119,43 +216,76 @@ def build_knowledge_packs(
     meta_root = Path(meta_dir)
 
     result = KnowledgePackBuildResult(output_dir=str(out_dir))
+    generated_at = utc_now_iso()
 
-    operators = store.list_operators()
-    fields = store.list_data_fields()
-    datasets = store.list_datasets()
+    operators, fields, datasets = store.load_knowledge_pack_inputs()
     validator = StaticValidator(operators=operators, fields=fields)
+    # Shared by the examples/counterexamples builders; scoped to this build so
+    # reports never outlive the metadata snapshot they were computed from.
+    validate = lru_cache(maxsize=512)(partial(validator.validate, alpha_type="REGULAR"))
 
     field_subcategory_lookup = _build_field_subcategory_lookup(fields=fields, datasets=datasets)
 
+    operator_path = out_dir / "operator_signature_pack.json"
+    settings_path = out_dir / "simulation_settings_allowed_pack.json"
+    examples_path = out_dir / "fastexpr_examples_pack.json"
+    counterexamples_path = out_dir / "fastexpr_counterexamples_pack.json"
+
+    # Packs 1-4 are independent, so build and write them concurrently; results
+    # are collected below in the fixed order to keep the build report stable.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        operator_future = pool.submit(
+            _build_and_write,
+            operator_path,
+            partial(_build_operator_signature_pack, operators, generated_at=generated_at),
+        )
+        settings_future = pool.submit(
+            _build_and_write,
+            settings_path,
+            partial(_build_settings_allowed_pack, meta_root, generated_at=generated_at),
+        )
+        examples_future = pool.submit(
+            _build_and_write,
+            examples_path,
+            partial(
+                _build_examples_pack,
+                validate=validate,
+                field_subcategory_lookup=field_subcategory_lookup,
+                generated_at=generated_at,
+            ),
+        )
+        counterexamples_future = pool.submit(
+            _build_and_write,
+            counterexamples_path,
+            partial(
+                _build_counterexamples_pack,
+                validate=validate,
+                fields=fields,
+                operators=operators,
+                generated_at=generated_at,
+            ),
+        )
+
     # 1) Operator signature pack
     try:
-        operator_pack = _build_operator_signature_pack(operators)
-        path = out_dir / "operator_signature_pack.json"
-        write_json(path, operator_pack.model_dump(mode="python"))
-        result.generated_files["operator_signature_pack"] = str(path)
+        operator_pack = operator_future.result()
+        result.generated_files["operator_signature_pack"] = str(operator_path)
         result.counts["operators"] = operator_pack.operator_count
     except Exception as exc:
         result.failed_parts["operator_signature_pack"] = str(exc)
 
     # 2) Settings allowed pack
     try:
-        settings_pack = _build_settings_allowed_pack(meta_root)
-        path = out_dir / "simulation_settings_allowed_pack.json"
-        write_json(path, settings_pack.model_dump(mode="python"))
-        result.generated_files["simulation_settings_allowed_pack"] = str(path)
+        settings_pack = settings_future.result()
+        result.generated_files["simulation_settings_allowed_pack"] = str(settings_path)
         result.counts["settings_keys"] = len(settings_pack.allowed.keys())
     except Exception as exc:
         result.failed_parts["simulation_settings_allowed_pack"] = str(exc)
 
     # 3) Examples pack
     try:
-        examples_pack = _build_examples_pack(
-            validator=validator,
-            field_subcategory_lookup=field_subcategory_lookup,
-        )
-        path = out_dir / "fastexpr_examples_pack.json"
-        write_json(path, examples_pack.model_dump(mode="python"))
-        result.generated_files["fastexpr_examples_pack"] = str(path)
+        examples_pack = examples_future.result()
+        result.generated_files["fastexpr_examples_pack"] = str(examples_path)
         result.counts["examples"] = len(examples_pack.examples)
         result.fallback_used = examples_pack.fallback_used
     except Exception as exc:
@@ -164,14 +294,8 @@ def build_knowledge_packs(
 
     # 4) Counter-examples pack
     try:
-        counterexamples_pack = _build_counterexamples_pack(
-            validator=validator,
-            fields=fields,
-            operators=operators,
-        )
-        path = out_dir / "fastexpr_counterexamples_pack.json"
-        write_json(path, counterexamples_pack.model_dump(mode="python"))
-        result.generated_files["fastexpr_counterexamples_pack"] = str(path)
+        counterexamples_pack = counterexamples_future.result()
+        result.generated_files["fastexpr_counterexamples_pack"] = str(counterexamples_path)
         result.counts["counterexamples"] = len(counterexamples_pack.cases)
     except Exception as exc:
         result.failed_parts["fastexpr_counterexamples_pack"] = str(exc)
@@ -183,9 +307,10 @@ def build_knowledge_packs(
         visual_pack = _build_visual_pack(
             operators=source_operators,
             examples=source_examples,
+            generated_at=generated_at,
         )
         path = out_dir / "fastexpr_visual_pack.json"
-        write_json(path, visual_pack.model_dump(mode="python"))
+        _write_pack(path, visual_pack)
         result.generated_files["fastexpr_visual_pack"] = str(path)
         result.counts["visual_operators"] = len(visual_pack.operators)
     except Exception as exc:
@@ -194,7 +319,26 @@ def build_knowledge_packs(
     return result
 
 
-def _build_operator_signature_pack(operators: list[dict[str, Any]]) -> OperatorSignaturePack:
+PackT = TypeVar("PackT", bound=BaseModel)
+
+
+def _build_and_write(path: Path, build: Callable[[], PackT]) -> PackT:
+    pack = build()
+    _write_pack(path, pack)
+    return pack
+
+
+def _write_pack(path: Path, pack: BaseModel) -> None:
+    # Serialize straight from pydantic-core instead of dumping to dicts and
+    # re-encoding with json (same UTF-8, indent=2 layout as write_json).
+    write_bytes(path, pack.model_dump_json(indent=2).encode("utf-8"))
+
+
+# Entry/card models below are built with model_construct: their inputs are
+# produced and cleaned here, and the enclosing *Pack models are validated.
+
+
+def _build_operator_signature_pack(operators: list[dict[str, Any]], *, generated_at: str) -> OperatorSignaturePack:
     rows = sorted(
         [row for row in operators if row.get("name")],
         key=lambda row: str(row.get("name")),
@@ -203,7 +347,7 @@ def _build_operator_signature_pack(operators: list[dict[str, Any]]) -> OperatorS
     missing: list[dict[str, Any]] = []
     for row in rows:
         name = str(row.get("name"))
-        entry = OperatorSignatureEntry(
+        entry = OperatorSignatureEntry.model_construct(
             name=name,
             definition=_as_optional_text(row.get("definition")),
             scope=_parse_scope(row.get("scope")),
@@ -221,21 +365,21 @@ def _build_operator_signature_pack(operators: list[dict[str, Any]]) -> OperatorS
         entries.append(entry)
 
     return OperatorSignaturePack(
-        generated_at=utc_now_iso(),
+        generated_at=generated_at,
         operator_count=len(entries),
         operators=entries,
         missing_required_fields=missing,
     )
 
 
-def _build_settings_allowed_pack(meta_dir: Path) -> SimulationSettingsAllowedPack:
+def _build_settings_allowed_pack(meta_dir: Path, *, generated_at: str) -> SimulationSettingsAllowedPack:
     primary_path = meta_dir / "simulations_options.json"
     fallback_path = Path("docs/artifacts/fixtures/simulations_options.sample.json")
     source_path = primary_path if primary_path.exists() else fallback_path
     if not source_path.exists():
         raise RuntimeError(f"simulations options not found: {primary_path} or {fallback_path}")
 
-    payload = json.loads(source_path.read_text(encoding="utf-8"))
+    payload = _load_json_file(source_path)
     snapshot_date = payload.get("date")
 
     if "allowed" in payload and isinstance(payload["allowed"], dict):
@@ -251,7 +395,7 @@ def _build_settings_allowed_pack(meta_dir: Path) -> SimulationSettingsAllowedPac
         flat_allowed[key] = values
 
     return SimulationSettingsAllowedPack(
-        generated_at=utc_now_iso(),
+        generated_at=generated_at,
         snapshot_date=str(snapshot_date) if snapshot_date else None,
         source=str(source_path),
         allowed=flat_allowed,
@@ -260,8 +404,9 @@ def _build_settings_allowed_pack(meta_dir: Path) -> SimulationSettingsAllowedPac
 
 def _build_examples_pack(
     *,
-    validator: StaticValidator,
+    validate: Callable[[str], ValidationReport],
     field_subcategory_lookup: dict[str, str],
+    generated_at: str,
 ) -> FastExprExamplesPack:
     candidates = _example_candidates()
     seen_expr: set[str] = set()
@@ -269,10 +414,14 @@ def _build_examples_pack(
 
     for candidate in candidates:
         expression = candidate["expression"].strip()
-        if not expression or expression in seen_expr:
+        if not expression:
             continue
+        # One hash operation: the set only grows for unseen expressions.
+        seen_before = len(seen_expr)
         seen_expr.add(expression)
-        report = validator.validate(expression, alpha_type="REGULAR")
+        if len(seen_expr) == seen_before:
+            continue
+        report = validate(expression)
         if not report.is_valid:
             continue
 
@@ -280,36 +429,34 @@ def _build_examples_pack(
             candidate.get("tags", []),
             _rule_tags_for_expression(expression),
         )
-        subcategory_tags = _merge_unique(
-            [field_subcategory_lookup.get(field, "unknown") for field in report.used_fields],
-            [],
-        )
         examples.append(
-            FastExprExampleEntry(
+            FastExprExampleEntry.model_construct(
                 expression=expression,
                 tags=tags,
                 used_fields=report.used_fields,
                 used_operators=report.used_operators,
-                subcategory_tags=[x for x in subcategory_tags if x and x != "unknown"],
+                subcategory_tags=_subcategory_tags(report.used_fields, field_subcategory_lookup),
                 source=str(candidate.get("source") or "curated"),
+                validation_passed=True,
             )
         )
 
     fallback_used = False
     if not examples:
         for fallback_expr in ("rank(ts_delta(log(close), 5))", "ts_step(1)"):
-            report = validator.validate(fallback_expr, alpha_type="REGULAR")
+            report = validate(fallback_expr)
             if not report.is_valid:
                 continue
             fallback_used = True
             examples.append(
-                FastExprExampleEntry(
+                FastExprExampleEntry.model_construct(
                     expression=fallback_expr,
                     tags=["starter", "rulebook-aligned", "fallback"],
                     used_fields=report.used_fields,
                     used_operators=report.used_operators,
-                    subcategory_tags=[field_subcategory_lookup.get(field, "unknown") for field in report.used_fields],
+                    subcategory_tags=_subcategory_tags(report.used_fields, field_subcategory_lookup),
                     source="fallback",
+                    validation_passed=True,
                 )
             )
             break
@@ -317,21 +464,30 @@ def _build_examples_pack(
             raise RuntimeError("No valid FastExpr examples available and fallback examples failed validation")
 
     return FastExprExamplesPack(
-        generated_at=utc_now_iso(),
+        generated_at=generated_at,
         fallback_used=fallback_used,
         examples=examples,
     )
 
 
+def _subcategory_tags(used_fields: list[str], field_subcategory_lookup: dict[str, str]) -> list[str]:
+    tags: list[str] = []
+    seen: set[str] = set()
+    for field in used_fields:
+        subcategory = field_subcategory_lookup.get(field, "").strip()
+        if subcategory and subcategory != "unknown" and subcategory not in seen:
+            seen.add(subcategory)
+            tags.append(subcategory)
+    return tags
+
+
 def _build_counterexamples_pack(
     *,
-    validator: StaticValidator,
+    validate: Callable[[str], ValidationReport],
     fields: list[dict[str, Any]],
     operators: list[dict[str, Any]],
+    generated_at: str,
 ) -> FastExprCounterExamplesPack:
-    known_operator_names = {str(row.get("name")) for row in operators if row.get("name")}
-    known_field_names = {str(row.get("id")) for row in fields if row.get("id")}
-
     invalid_cases = [
         "unknown_operator(close)",
         "rank(unknown_data_field_123)",
@@ -344,20 +500,25 @@ def _build_counterexamples_pack(
 
     cases: list[CounterExampleCase] = []
     for expression in invalid_cases:
-        report = validator.validate(expression, alpha_type="REGULAR")
-        if report.is_valid or not report.errors:
-            continue
-        first = classify_validation_error(report.errors[0])
-        # Safety checks to keep counterexamples meaningful.
-        if expression and expression in known_operator_names:
+        error_message = _cheap_syntax_reject(expression)
+        if error_message is None:
+            report = validate(expression)
+            if report.is_valid or not report.errors:
+                continue
+            error_message = report.errors[0]
+        first = classify_validation_error(error_message)
+        # Safety checks to keep counterexamples meaningful. Only a handful of
+        # failing cases reach here, so scan on demand instead of building
+        # name sets over the whole catalog up front.
+        if expression and any(row.get("name") and str(row.get("name")) == expression for row in operators):
             continue
-        if expression and expression in known_field_names:
+        if expression and any(row.get("id") and str(row.get("id")) == expression for row in fields):
             continue
         cases.append(
-            CounterExampleCase(
+            CounterExampleCase.model_construct(
                 expression=expression,
                 error_type=first["error_key"],
-                error_message=report.errors[0],
+                error_message=error_message,
                 fix_hint=first["fix_hint"],
             )
         )
@@ -366,53 +527,63 @@ def _build_counterexamples_pack(
         raise RuntimeError("Failed to build counterexamples pack: no invalid cases were captured")
 
     return FastExprCounterExamplesPack(
-        generated_at=utc_now_iso(),
+        generated_at=generated_at,
         cases=cases,
     )
 
 
+def _cheap_syntax_reject(expression: str) -> str | None:
+    # Returns the first error StaticValidator.validate would report for
+    # obviously malformed input (empty / mismatched parenthesis counts), so
+    # those cases skip the full validation pass.
+    if not expression.strip():
+        return "Expression is empty"
+    if expression.count("(") != expression.count(")") and ALLOWED_CHAR_RE.match(expression):
+        return "Parentheses are not balanced"
+    return None
+
+
 def _build_visual_pack(
     *,
     operators: list[OperatorSignatureEntry],
     examples: list[FastExprExampleEntry],
+    generated_at: str,
 ) -> FastExprVisualPack:
     cards: list[VisualOperatorCard] = []
+    # Categories repeat across the catalog: intern them and resolve each
+    # category's display style once.
+    display_by_category: dict[str, dict[str, str]] = {}
     for operator in operators:
-        category = operator.category or "Uncategorized"
+        category = sys.intern(operator.category or "Uncategorized")
+        display = display_by_category.get(category)
+        if display is None:
+            display = display_by_category[category] = _display_style_for_operator(category)
         cards.append(
-            VisualOperatorCard(
+            VisualOperatorCard.model_construct(
                 name=operator.name,
                 category=category,
                 scope=operator.scope,
                 signature=operator.definition or f"{operator.name}(...)",
-                display=_display_style_for_operator(category),
+                display=display,
                 tips=_tips_for_operator(operator.name, category),
             )
         )
 
-    error_taxonomy = [
-        {
-            "error_key": row["error_key"],
-            "match_pattern": row["match_pattern"],
-            "severity": row["severity"],
-            "fix_hint": row["fix_hint"],
-        }
-        for row in VALIDATION_ERROR_TAXONOMY
-    ]
-
+    # Cards share scope/tags lists with their source entries and one
+    # quality-flags dict; none of them are mutated after construction.
     example_cards = [
-        VisualExampleCard(
+        VisualExampleCard.model_construct(
             expression=entry.expression,
             tags=entry.tags,
-            quality_flags={"validation_passed": True, "counterexample": False},
+            quality_flags=_EXAMPLE_QUALITY_FLAGS,
         )
         for entry in examples
     ]
 
     return FastExprVisualPack(
-        generated_at=utc_now_iso(),
+        generated_at=generated_at,
         operators=cards,
-        error_taxonomy=error_taxonomy,
+        error_taxonomy=_ERROR_TAXONOMY_VIEW,
         example_cards=example_cards,
     )
 
@@ -462,7 +633,7 @@ def _expression_from_alpha_fixture(path: Path) -> str | None:
     if not path.exists():
         return None
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = _load_json_file(path)
     except Exception:
         return None
     regular = payload.get("regular")
@@ -473,6 +644,18 @@ def _expression_from_alpha_fixture(path: Path) -> str | None:
     return None
 
 
+def _load_json_file(path: Path) -> Any:
+    # Parsed payloads are reused while the file is unchanged; callers share
+    # the returned object and must not mutate it.
+    stat = path.stat()
+    return _load_json_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    return json_loads(Path(path).read_bytes())
+
+
 def _build_field_subcategory_lookup(
     *,
     fields: list[dict[str, Any]],
@@ -480,22 +663,24 @@ def _build_field_subcategory_lookup(
 ) -> dict[str, str]:
     dataset_to_subcategory: dict[str, str] = {}
     for dataset in datasets:
-        dataset_id = str(dataset.get("id") or "")
+        dataset_id = dataset.get("id")
         if not dataset_id:
             continue
-        raw = _parse_raw_json(dataset.get("raw_json"))
-        subcategory = raw.get("subcategory") if isinstance(raw.get("subcategory"), dict) else {}
-        sub_id = str(subcategory.get("id") or "unknown")
-        dataset_to_subcategory[dataset_id] = sub_id
-
-    out: dict[str, str] = {}
-    for field in fields:
-        field_id = str(field.get("id") or "")
-        dataset_id = str(field.get("dataset_id") or "")
-        if not field_id:
-            continue
-        out[field_id] = dataset_to_subcategory.get(dataset_id, "unknown")
-    return out
+        raw = dataset.get("raw_json")
+        if isinstance(raw, str) and raw:
+            try:
+                raw = json_loads(raw)
+            except Exception:
+                raw = None
+        subcategory = raw.get("subcategory") if isinstance(raw, dict) else None
+        sub_id = subcategory.get("id") if isinstance(subcategory, dict) else None
+        dataset_to_subcategory[str(dataset_id)] = str(sub_id) if sub_id else "unknown"
+
+    return {
+        str(field["id"]): dataset_to_subcategory.get(str(field.get("dataset_id") or ""), "unknown")
+        for field in fields
+        if field.get("id")
+    }
 
 
 def _extract_allowed_nodes_from_raw_options(payload: dict[str, Any]) -> dict[str, Any]:
@@ -514,120 +699,87 @@ def _extract_choice_values(choices: Any) -> list[Any]:
 
 
 def _collect_choice_values(node: Any, out: list[Any]) -> None:
-    if isinstance(node, list):
-        for item in node:
-            if isinstance(item, dict) and "value" in item:
-                out.append(item["value"])
+    # Depth-first walk with an explicit stack. Children are pushed in reverse
+    # so values come out in document order; the flag marks direct list items,
+    # where any {"value": ...} dict counts as a choice regardless of size.
+    stack: list[tuple[Any, bool]] = [(node, False)]
+    while stack:
+        current, in_list = stack.pop()
+        if isinstance(current, list):
+            stack.extend((item, True) for item in reversed(current))
+        elif isinstance(current, dict):
+            if "value" in current and (in_list or len(current) <= 3):
+                out.append(current["value"])
             else:
-                _collect_choice_values(item, out)
-        return
-    if isinstance(node, dict):
-        if "value" in node and len(node.keys()) <= 3:
-            out.append(node["value"])
-            return
-        for value in node.values():
-            _collect_choice_values(value, out)
-        return
-    if node is not None:
-        out.append(node)
+                stack.extend((value, False) for value in reversed(current.values()))
+        elif current is not None:
+            out.append(current)
 
 
 def _dedupe_values(values: list[Any]) -> list[Any]:
     deduped: list[Any] = []
-    seen: set[str] = set()
+    seen_simple: set[tuple[type, Any]] = set()
+    seen_json: set[bytes] = set()
     for value in values:
-        key = json.dumps(value, ensure_ascii=False, sort_keys=True)
-        if key in seen:
-            continue
-        seen.add(key)
+        # Choices are almost always str/int/bool/None. Keying on (type, value)
+        # keeps 1, True and "1" apart exactly like their JSON encodings do;
+        # floats still go through JSON so 0.0 and -0.0 stay distinct.
+        value_type = type(value)
+        if value_type in _SIMPLE_CHOICE_TYPES:
+            simple_key = (value_type, value)
+            if simple_key in seen_simple:
+                continue
+            seen_simple.add(simple_key)
+        else:
+            key = dumps_bytes(value, sort_keys=True)
+            if key in seen_json:
+                continue
+            seen_json.add(key)
         deduped.append(value)
     return deduped
 
 
 def _rule_tags_for_expression(expression: str) -> list[str]:
-    lower = expression.lower()
-    tags: list[str] = ["regular-signal"]
-    if "ts_" in lower:
-        tags.append("timeseries-window")
-    if "group_" in lower:
-        tags.append("group-neutralization")
-    if "vec_" in lower:
-        tags.append("vector-aggregated")
-    if "rank(" in lower or "zscore(" in lower:
-        tags.append("cross-sectional-normalization")
-    if "trade_when(" in lower or "if_else(" in lower:
-        tags.append("conditional-logic")
-    if "hump(" in lower or "ts_decay_linear(" in lower:
-        tags.append("turnover-control")
-    if "bucket(" in lower:
-        tags.append("group-bucketing")
-    return _merge_unique(tags, [])
+    matched: set[str] = set()
+    for marker in _RULE_TAG_MARKER_RE.findall(expression.lower()):
+        matched.update(_RULE_TAG_MARKERS[marker])
+    return ["regular-signal", *(tag for tag in _RULE_TAG_ORDER if tag in matched)]
 
 
 def _display_style_for_operator(category: str) -> dict[str, str]:
-    key = category.strip().lower()
-    mapping = {
-        "time series": {"group": "timeseries", "badge_color": "cyan", "complexity": "medium"},
-        "cross sectional": {"group": "cross_sectional", "badge_color": "amber", "complexity": "low"},
-        "group": {"group": "group_ops", "badge_color": "orange", "complexity": "medium"},
-        "transform": {"group": "transform", "badge_color": "blue", "complexity": "low"},
-        "vector": {"group": "vector_ops", "badge_color": "green", "complexity": "medium"},
-        "logical": {"group": "logical", "badge_color": "rose", "complexity": "medium"},
-    }
-    return mapping.get(key, {"group": "misc", "badge_color": "slate", "complexity": "medium"})
+    return _DISPLAY_STYLES.get(category.strip().lower(), _DISPLAY_STYLE_DEFAULT)
 
 
 def _tips_for_operator(name: str, category: str) -> list[str]:
     lname = name.lower()
-    lcat = category.lower()
     if lname.startswith("ts_"):
-        return [
-            "MATRIX 필드와 lookback(d) 인자를 함께 사용",
-            "결측치가 많은 필드는 ts_backfill 후 결합 검토",
-        ]
+        return _TIPS_TIMESERIES_OP
     if lname.startswith("group_") or lname == "group_neutralize":
-        return [
-            "GROUP + MATRIX 조합을 맞춰야 타입 위반을 피함",
-            "GROUP 필드가 없으면 bucket(rank(cap)) 패턴 고려",
-        ]
+        return _TIPS_GROUP
     if lname.startswith("vec_"):
-        return [
-            "VECTOR 필드는 vec_ 계열로 집계 후 후속 연산에 전달",
-            "vec_ 결과를 rank/zscore와 조합해 스케일 안정화",
-        ]
+        return _TIPS_VECTOR
     if lname in {"rank", "zscore", "quantile", "scale"}:
-        return [
-            "동일 단계에서 중복 정규화를 과도하게 쌓지 않기",
-            "단위가 다른 필드 결합 전 정규화 우선 적용",
-        ]
+        return _TIPS_NORMALIZATION
     if lname in {"trade_when", "if_else"}:
-        return [
-            "조건식 중첩을 최소화해 디버깅 가능성 유지",
-            "entry/exit 조건의 의미를 generation_notes에 남기기",
-        ]
+        return _TIPS_CONDITIONAL
     if lname in {"hump", "ts_decay_linear"}:
-        return [
-            "turnover 제어 연산은 신호 생성 이후 후단에 배치",
-            "감쇠 강도가 높을수록 반응성이 낮아질 수 있음",
-        ]
-    if lcat == "time series":
-        return [
-            "시계열 lookback은 신호 시간축과 일치시킬 것",
-            "이상치/결측이 많은 경우 robust 연산자 우선 고려",
-        ]
-    return [
-        "operators metadata의 signature/scope를 우선 준수",
-        "retrieval pack 후보 내 field/operator만 조합",
-    ]
+        return _TIPS_TURNOVER
+    if category.lower() == "time series":
+        return _TIPS_TIMESERIES_CATEGORY
+    return _TIPS_DEFAULT
 
 
 def _parse_scope(scope: Any) -> list[str]:
     if scope is None:
         return []
     if isinstance(scope, list):
-        return [str(x).strip() for x in scope if str(x).strip()]
+        # Fast path: already a list of clean, non-empty strings.
+        if all(type(x) is str and x and x == x.strip() for x in scope):
+            return list(scope)
+        return [item for item in (str(x).strip() for x in scope) if item]
     if isinstance(scope, str):
-        return [x.strip() for x in scope.split(",") if x.strip()]
+        # SQLite stores scope comma-joined; strip each part only once.
+        return [item for item in (x.strip() for x in scope.split(",")) if item]
     return [str(scope)]
 
 
@@ -641,24 +793,13 @@ def _as_optional_text(value: Any) -> str | None:
 def _merge_unique(first: list[str], second: list[str]) -> list[str]:
     out: list[str] = []
     seen: set[str] = set()
-    for item in [*first, *second]:
+    add = seen.add
+    for item in chain(first, second):
         normalized = str(item).strip()
-        if not normalized or normalized in seen:
+        if not normalized:
             continue
-        seen.add(normalized)
-        out.append(normalized)
+        seen_before = len(seen)
+        add(normalized)
+        if len(seen) != seen_before:
+            out.append(normalized)
     return out
-
-
-def _parse_raw_json(value: Any) -> dict[str, Any]:
-    if isinstance(value, dict):
-        return value
-    if not isinstance(value, str) or not value:
-        return {}
-    try:
-        parsed = json.loads(value)
-        if isinstance(parsed, dict):
-            return parsed
-    except Exception:
-        return {}
-    return {}
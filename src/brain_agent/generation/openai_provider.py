@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from dataclasses import dataclass, field
-from typing import Any, Literal
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterator, Literal
 
 
 ReasoningEffort = Literal["minimal", "low", "medium", "high"]
@@ -17,7 +19,7 @@ class OpenAIProviderError(RuntimeError):
     """Raised when OpenAI provider setup or API calls fail."""
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenAILLMSettings:
     model: str = "gpt-5.2"
     reasoning_effort: ReasoningEffort = "medium"
@@ -25,43 +27,87 @@ class OpenAILLMSettings:
     reasoning_summary: ReasoningSummary = "auto"
     max_output_tokens: int = 2200
     timeout_sec: float = 90.0
+    batch_size: int = 8
+    max_concurrency: int = 32
+    stream: bool = False
 
     @classmethod
     def from_env(cls) -> "OpenAILLMSettings":
-        model = str(os.getenv("BRAIN_LLM_MODEL") or "gpt-5.2").strip() or "gpt-5.2"
-
-        effort_raw = str(os.getenv("BRAIN_LLM_REASONING_EFFORT") or "medium").strip().lower()
-        effort = effort_raw if effort_raw in {"minimal", "low", "medium", "high"} else "medium"
-
-        verbosity_raw = str(os.getenv("BRAIN_LLM_VERBOSITY") or "medium").strip().lower()
-        verbosity = verbosity_raw if verbosity_raw in {"low", "medium", "high"} else "medium"
-
-        summary_raw = str(os.getenv("BRAIN_LLM_REASONING_SUMMARY") or "auto").strip().lower()
-        summary = summary_raw if summary_raw in {"auto", "concise", "detailed"} else "auto"
-
-        max_output_tokens_raw = os.getenv("BRAIN_LLM_MAX_OUTPUT_TOKENS")
-        try:
-            max_output_tokens = max(256, int(max_output_tokens_raw)) if max_output_tokens_raw else 2200
-        except Exception:
-            max_output_tokens = 2200
-
-        timeout_raw = os.getenv("BRAIN_LLM_TIMEOUT_SEC")
-        try:
-            timeout_sec = max(5.0, float(timeout_raw)) if timeout_raw else 90.0
-        except Exception:
-            timeout_sec = 90.0
-
-        return cls(
-            model=model,
-            reasoning_effort=effort,  # type: ignore[arg-type]
-            verbosity=verbosity,  # type: ignore[arg-type]
-            reasoning_summary=summary,  # type: ignore[arg-type]
-            max_output_tokens=max_output_tokens,
-            timeout_sec=timeout_sec,
-        )
-
-
-@dataclass
+        # Parsing is memoized on the raw env values (so later load_dotenv()
+        # calls are still honoured); each caller gets its own copy.
+        return replace(_settings_from_env_values(tuple(os.getenv(name) for name in _SETTINGS_ENV_VARS)))
+
+
+_SETTINGS_ENV_VARS = (
+    "BRAIN_LLM_MODEL",
+    "BRAIN_LLM_REASONING_EFFORT",
+    "BRAIN_LLM_VERBOSITY",
+    "BRAIN_LLM_REASONING_SUMMARY",
+    "BRAIN_LLM_MAX_OUTPUT_TOKENS",
+    "BRAIN_LLM_TIMEOUT_SEC",
+    "BRAIN_LLM_BATCH_SIZE",
+    "BRAIN_LLM_STREAM",
+)
+
+_REASONING_EFFORTS: dict[str, ReasoningEffort] = {
+    "minimal": "minimal",
+    "low": "low",
+    "medium": "medium",
+    "high": "high",
+}
+_VERBOSITY_LEVELS: dict[str, VerbosityLevel] = {"low": "low", "medium": "medium", "high": "high"}
+_REASONING_SUMMARIES: dict[str, ReasoningSummary] = {"auto": "auto", "concise": "concise", "detailed": "detailed"}
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+@lru_cache(maxsize=8)
+def _settings_from_env_values(values: tuple[str | None, ...]) -> OpenAILLMSettings:
+    (
+        model_env,
+        effort_env,
+        verbosity_env,
+        summary_env,
+        max_output_tokens_raw,
+        timeout_raw,
+        batch_size_raw,
+        stream_raw,
+    ) = values
+    model = str(model_env or "gpt-5.2").strip() or "gpt-5.2"
+
+    effort = _REASONING_EFFORTS.get(str(effort_env or "").strip().lower(), "medium")
+    verbosity = _VERBOSITY_LEVELS.get(str(verbosity_env or "").strip().lower(), "medium")
+    summary = _REASONING_SUMMARIES.get(str(summary_env or "").strip().lower(), "auto")
+
+    try:
+        max_output_tokens = max(256, int(max_output_tokens_raw)) if max_output_tokens_raw else 2200
+    except Exception:
+        max_output_tokens = 2200
+
+    try:
+        timeout_sec = max(5.0, float(timeout_raw)) if timeout_raw else 90.0
+    except Exception:
+        timeout_sec = 90.0
+
+    try:
+        batch_size = max(1, int(batch_size_raw)) if batch_size_raw else 8
+    except Exception:
+        batch_size = 8
+
+    stream = str(stream_raw or "").strip().lower() in _TRUTHY_ENV_VALUES
+
+    return OpenAILLMSettings(
+        model=model,
+        reasoning_effort=effort,
+        verbosity=verbosity,
+        reasoning_summary=summary,
+        max_output_tokens=max_output_tokens,
+        timeout_sec=timeout_sec,
+        batch_size=batch_size,
+        stream=stream,
+    )
+
+
+@dataclass(slots=True)
 class LLMCallResult:
     text: str
     usage: dict[str, Any] = field(default_factory=dict)
@@ -86,12 +132,10 @@ class OpenAIResponsesJSONClient:
         if not key:
             raise OpenAIProviderError("OPENAI_API_KEY is not set")
 
-        try:
-            from openai import OpenAI
-        except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
-            raise OpenAIProviderError("openai SDK is not installed. Run pip install -r requirements.txt") from exc
-
-        self.client = OpenAI(api_key=key, timeout=self.settings.timeout_sec)
+        self._api_key = key
+        self.client = _shared_openai_client(key, self.settings.timeout_sec)
+        self._aclient: Any = None
+        self._request_templates: dict[str, dict[str, Any]] = {}
 
     def generate_idea_spec(self, prompt: str) -> LLMCallResult:
         return self._generate_structured_json(
@@ -109,6 +153,87 @@ class OpenAIResponsesJSONClient:
             stage_hint="alpha_maker",
         )
 
+    def generate_idea_specs_batch(self, prompts: list[str]) -> list[LLMCallResult]:
+        """Generate one IdeaSpec per prompt, packing up to batch_size prompts per call."""
+        return self._generate_structured_json_batch(
+            prompts=prompts,
+            schema_name="idea_spec",
+            schema=IDEA_SPEC_JSON_SCHEMA,
+            stage_hint="idea_research",
+        )
+
+    def generate_candidate_alphas_batch(self, prompts: list[str]) -> list[LLMCallResult]:
+        """Generate one CandidateAlpha per prompt, packing up to batch_size prompts per call."""
+        return self._generate_structured_json_batch(
+            prompts=prompts,
+            schema_name="candidate_alpha",
+            schema=CANDIDATE_ALPHA_JSON_SCHEMA,
+            stage_hint="alpha_maker",
+        )
+
+    def _generate_structured_json_batch(
+        self,
+        *,
+        prompts: list[str],
+        schema_name: str,
+        schema: dict[str, Any],
+        stage_hint: str,
+    ) -> list[LLMCallResult]:
+        results: list[LLMCallResult] = []
+        size = max(1, int(self.settings.batch_size))
+        for start in range(0, len(prompts), size):
+            chunk = prompts[start : start + size]
+            if len(chunk) == 1:
+                results.append(
+                    self._generate_structured_json(
+                        prompt=chunk[0],
+                        schema_name=schema_name,
+                        schema=schema,
+                        stage_hint=stage_hint,
+                    )
+                )
+                continue
+            call = self._generate_structured_json(
+                prompt=_batch_prompt(chunk),
+                schema_name=f"{schema_name}_batch",
+                schema=_batch_schema(schema, len(chunk)),
+                stage_hint=stage_hint,
+            )
+            results.extend(_split_batch_result(call, len(chunk)))
+        return results
+
+    async def agenerate_idea_spec(self, prompt: str) -> LLMCallResult:
+        return await self._agenerate_structured_json(
+            prompt=prompt,
+            schema_name="idea_spec",
+            schema=IDEA_SPEC_JSON_SCHEMA,
+            stage_hint="idea_research",
+        )
+
+    async def agenerate_candidate_alpha(self, prompt: str) -> LLMCallResult:
+        return await self._agenerate_structured_json(
+            prompt=prompt,
+            schema_name="candidate_alpha",
+            schema=CANDIDATE_ALPHA_JSON_SCHEMA,
+            stage_hint="alpha_maker",
+        )
+
+    async def agenerate_idea_specs(self, prompts: list[str]) -> list[LLMCallResult]:
+        """Concurrent agenerate_idea_spec over prompts (bounded by max_concurrency)."""
+        return await gather_structured_json(
+            prompts,
+            self.agenerate_idea_spec,
+            max_concurrency=self.settings.max_concurrency,
+        )
+
+    async def agenerate_candidate_alphas(self, prompts: list[str]) -> list[LLMCallResult]:
+        """Concurrent agenerate_candidate_alpha over prompts (bounded by max_concurrency)."""
+        return await gather_structured_json(
+            prompts,
+            self.agenerate_candidate_alpha,
+            max_concurrency=self.settings.max_concurrency,
+        )
+
     def _generate_structured_json(
         self,
         *,
@@ -117,37 +242,89 @@ class OpenAIResponsesJSONClient:
         schema: dict[str, Any],
         stage_hint: str,
     ) -> LLMCallResult:
-        text_cfg: dict[str, Any] = {
-            "verbosity": self.settings.verbosity,
-            "format": {
-                "type": "json_schema",
-                "name": schema_name,
-                "strict": True,
-                "schema": schema,
+        request = self._build_request(prompt=prompt, schema_name=schema_name, schema=schema, stage_hint=stage_hint)
+        try:
+            if self.settings.stream:
+                # Output arrives incrementally over an open connection; the
+                # final event carries the same Response object create() returns.
+                with self.client.responses.stream(**request) as stream:
+                    response = stream.get_final_response()
+            else:
+                response = self.client.responses.create(**request)
+        except Exception as exc:  # pragma: no cover - network/runtime failure
+            raise OpenAIProviderError(f"OpenAI responses.create failed: {exc}") from exc
+        return self._call_result(response)
+
+    async def _agenerate_structured_json(
+        self,
+        *,
+        prompt: str,
+        schema_name: str,
+        schema: dict[str, Any],
+        stage_hint: str,
+    ) -> LLMCallResult:
+        request = self._build_request(prompt=prompt, schema_name=schema_name, schema=schema, stage_hint=stage_hint)
+        try:
+            aclient = self._get_async_client()
+            if self.settings.stream:
+                async with aclient.responses.stream(**request) as stream:
+                    response = await stream.get_final_response()
+            else:
+                response = await aclient.responses.create(**request)
+        except OpenAIProviderError:
+            raise
+        except Exception as exc:  # pragma: no cover - network/runtime failure
+            raise OpenAIProviderError(f"OpenAI responses.create failed: {exc}") from exc
+        return self._call_result(response)
+
+    def _get_async_client(self) -> Any:
+        # Created lazily per instance: async connection pools are bound to
+        # the event loop they were opened on, so they are not shared globally.
+        if self._aclient is None:
+            httpx, openai = _openai_sdk()
+            self._aclient = openai.AsyncOpenAI(
+                api_key=self._api_key,
+                timeout=self.settings.timeout_sec,
+                **_http_client_kwargs(httpx, "AsyncClient", self.settings.timeout_sec),
+            )
+        return self._aclient
+
+    def _build_request(
+        self,
+        *,
+        prompt: str,
+        schema_name: str,
+        schema: dict[str, Any],
+        stage_hint: str,
+    ) -> dict[str, Any]:
+        # Only input varies per call; the rest is shared (the SDK never mutates it).
+        template = self._request_templates.get(schema_name)
+        if template is None or template["text"]["format"]["schema"] is not schema:
+            template = self._request_template(schema_name, schema)
+            self._request_templates[schema_name] = template
+
+        request = dict(template)
+        request["input"] = [
+            _developer_message(stage_hint),
+            {
+                "role": "user",
+                "content": [{"type": "input_text", "text": prompt}],
             },
-        }
+        ]
+        return request
 
-        request: dict[str, Any] = {
+    def _request_template(self, schema_name: str, schema: dict[str, Any]) -> dict[str, Any]:
+        return {
             "model": self.settings.model,
-            "input": [
-                {
-                    "role": "developer",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": (
-                                "Return only a JSON object that matches the schema exactly. "
-                                f"Stage={stage_hint}. No markdown, no prose."
-                            ),
-                        }
-                    ],
-                },
-                {
-                    "role": "user",
-                    "content": [{"type": "input_text", "text": prompt}],
+            "text": {
+                "verbosity": self.settings.verbosity,
+                "format": {
+                    "type": "json_schema",
+                    "name": schema_name,
+                    "strict": True,
+                    "schema": schema,
                 },
-            ],
-            "text": text_cfg,
+            },
             "max_output_tokens": self.settings.max_output_tokens,
             "reasoning": {
                 "effort": self.settings.reasoning_effort,
@@ -155,15 +332,10 @@ class OpenAIResponsesJSONClient:
             },
         }
 
-        try:
-            response = self.client.responses.create(**request)
-        except Exception as exc:  # pragma: no cover - network/runtime failure
-            raise OpenAIProviderError(f"OpenAI responses.create failed: {exc}") from exc
-
-        response_dict = _to_dict(response)
-        refusal = _extract_refusal(response_dict)
-        output_text = _extract_output_text(response, response_dict)
-        usage = _extract_usage(response, response_dict)
+    def _call_result(self, response: Any) -> LLMCallResult:
+        refusal = _extract_refusal(response)
+        output_text = _extract_output_text(response)
+        usage = _extract_usage(response)
 
         if not output_text:
             if refusal:
@@ -175,99 +347,249 @@ class OpenAIResponsesJSONClient:
             usage=usage,
             provider="openai",
             model=self.settings.model,
-            response_id=str(response_dict.get("id") or "") or None,
+            response_id=str(_field(response, "id") or "") or None,
             refusal=refusal,
         )
 
 
+async def gather_structured_json(
+    prompts: list[str],
+    generate: Callable[[str], Awaitable[LLMCallResult]],
+    *,
+    max_concurrency: int = 32,
+) -> list[LLMCallResult]:
+    """Run an async generator (e.g. client.agenerate_idea_spec) over prompts concurrently.
+
+    Results keep prompt order; at most max_concurrency requests are in flight.
+    """
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+    async def run(prompt: str) -> LLMCallResult:
+        async with semaphore:
+            return await generate(prompt)
+
+    return list(await asyncio.gather(*(run(prompt) for prompt in prompts)))
+
+
+_OPENAI_SDK: tuple[Any, Any] | None = None
+
+
+def _openai_sdk() -> tuple[Any, Any]:
+    """Import (httpx, openai) on first use; later calls reuse the resolved modules.
+
+    httpx is None when it cannot be imported; callers then let the SDK build
+    its own HTTP client instead of passing a pooled one.
+    """
+    global _OPENAI_SDK
+    if _OPENAI_SDK is None:
+        try:
+            import openai
+        except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+            raise OpenAIProviderError("openai SDK is not installed. Run pip install -r requirements.txt") from exc
+        try:
+            import httpx
+        except ModuleNotFoundError:  # pragma: no cover - optional dependency
+            httpx = None
+        _OPENAI_SDK = (httpx, openai)
+    return _OPENAI_SDK
+
+
+def _http_client_kwargs(httpx: Any, client_cls_name: str, timeout_sec: float) -> dict[str, Any]:
+    if httpx is None:
+        return {}
+    http_client = getattr(httpx, client_cls_name)(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0),
+        timeout=timeout_sec,
+        follow_redirects=True,
+    )
+    return {"http_client": http_client}
+
+
+# One pooled SDK client per (api_key, timeout) so keep-alive connections are
+# reused across client instances (e.g. one OpenAIResponsesJSONClient per idea).
+_CLIENT_CACHE: dict[tuple[str, float], Any] = {}
+
+
+def _shared_openai_client(api_key: str, timeout_sec: float) -> Any:
+    cache_key = (api_key, float(timeout_sec))
+    client = _CLIENT_CACHE.get(cache_key)
+    if client is not None:
+        return client
+
+    httpx, openai = _openai_sdk()
+    client = openai.OpenAI(
+        api_key=api_key,
+        timeout=timeout_sec,
+        **_http_client_kwargs(httpx, "Client", timeout_sec),
+    )
+    _CLIENT_CACHE[cache_key] = client
+    return client
+
+
+@lru_cache(maxsize=None)
+def _developer_message(stage_hint: str) -> dict[str, Any]:
+    return {
+        "role": "developer",
+        "content": [
+            {
+                "type": "input_text",
+                "text": (
+                    "Return only a JSON object that matches the schema exactly. "
+                    f"Stage={stage_hint}. No markdown, no prose."
+                ),
+            }
+        ],
+    }
+
+
+_BATCH_SCHEMAS: dict[tuple[int, int], tuple[dict[str, Any], dict[str, Any]]] = {}
+
+
+def _batch_schema(item_schema: dict[str, Any], count: int) -> dict[str, Any]:
+    # One shared object per (item schema, size) keeps the per-client request
+    # template cache warm for batch calls too. The entry holds item_schema,
+    # so its id() cannot be reused while cached.
+    key = (id(item_schema), count)
+    cached = _BATCH_SCHEMAS.get(key)
+    if cached is not None and cached[0] is item_schema:
+        return cached[1]
+    schema = {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": item_schema,
+                "minItems": count,
+                "maxItems": count,
+            }
+        },
+        "required": ["items"],
+    }
+    _BATCH_SCHEMAS[key] = (item_schema, schema)
+    return schema
+
+
+def _batch_prompt(prompts: list[str]) -> str:
+    header = (
+        f"Answer each of the {len(prompts)} items below independently. "
+        'Return {"items": [...]} with exactly one result per item, in item order.'
+    )
+    sections = [f"# Item {idx}\n{prompt}" for idx, prompt in enumerate(prompts)]
+    return "\n\n".join([header, *sections])
+
+
+def _split_batch_result(call: LLMCallResult, count: int) -> list[LLMCallResult]:
+    try:
+        items = json.loads(call.text).get("items")
+    except Exception as exc:
+        raise OpenAIProviderError(f"Batched response is not a JSON object: {exc}") from exc
+    if not isinstance(items, list) or len(items) != count:
+        got = len(items) if isinstance(items, list) else "no"
+        raise OpenAIProviderError(f"Batched response returned {got} items, expected {count}")
+
+    return [
+        LLMCallResult(
+            text=json.dumps(item, ensure_ascii=False),
+            usage=_prorate_usage(call.usage, count, idx),
+            provider=call.provider,
+            model=call.model,
+            response_id=call.response_id,
+            refusal=call.refusal,
+        )
+        for idx, item in enumerate(items)
+    ]
+
+
+def _prorate_usage(usage: dict[str, Any], count: int, index: int) -> dict[str, Any]:
+    # Integer token counts are split evenly; the first items absorb the
+    # remainder so per-item shares still sum to the batch total.
+    out: dict[str, Any] = {}
+    for key, value in usage.items():
+        if isinstance(value, dict):
+            out[key] = _prorate_usage(value, count, index)
+        elif isinstance(value, int) and not isinstance(value, bool):
+            share, remainder = divmod(value, count)
+            out[key] = share + (1 if index < remainder else 0)
+        else:
+            out[key] = value
+    return out
+
+
+_DICT_DUMPERS: dict[type, Callable[..., Any] | None] = {}
+
+
 def _to_dict(value: Any) -> dict[str, Any]:
     if isinstance(value, dict):
         return value
-    if hasattr(value, "model_dump"):
-        try:
-            dumped = value.model_dump(mode="python")
-            if isinstance(dumped, dict):
-                return dumped
-        except Exception:
-            return {}
-    return {}
+    # SDK response types are fixed per process; resolve the dumper once per type.
+    value_type = type(value)
+    try:
+        dumper = _DICT_DUMPERS[value_type]
+    except KeyError:
+        dumper = getattr(value_type, "model_dump", None)
+        _DICT_DUMPERS[value_type] = dumper
+    if dumper is None:
+        return {}
+    try:
+        dumped = dumper(value, mode="python")
+    except Exception:
+        return {}
+    return dumped if isinstance(dumped, dict) else {}
+
+
+def _field(value: Any, name: str) -> Any:
+    # SDK objects expose fields as attributes, so only the parts read here are
+    # touched instead of dumping the whole response tree (reasoning included).
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
 
 
-def _extract_output_text(response: Any, response_dict: dict[str, Any]) -> str:
-    text = getattr(response, "output_text", None)
+def _message_content(response: Any) -> Iterator[Any]:
+    output = _field(response, "output")
+    if not isinstance(output, list):
+        return
+    for item in output:
+        if _field(item, "type") != "message":
+            continue
+        content = _field(item, "content")
+        if isinstance(content, list):
+            yield from content
+
+
+def _extract_output_text(response: Any) -> str:
+    text = _field(response, "output_text")
     if isinstance(text, str) and text.strip():
         return text.strip()
 
-    output = response_dict.get("output")
-    if not isinstance(output, list):
-        return ""
-
     parts: list[str] = []
-    for item in output:
-        if not isinstance(item, dict):
-            continue
-        if item.get("type") != "message":
+    for chunk in _message_content(response):
+        if _field(chunk, "type") != "output_text":
             continue
-        content = item.get("content")
-        if not isinstance(content, list):
-            continue
-        for chunk in content:
-            if not isinstance(chunk, dict):
-                continue
-            if chunk.get("type") != "output_text":
-                continue
-            text_value = chunk.get("text")
-            if isinstance(text_value, str) and text_value.strip():
-                parts.append(text_value)
+        text_value = _field(chunk, "text")
+        if isinstance(text_value, str) and text_value.strip():
+            parts.append(text_value)
 
     return "\n".join(parts).strip()
 
 
-def _extract_refusal(response_dict: dict[str, Any]) -> str | None:
-    direct = response_dict.get("refusal")
+def _extract_refusal(response: Any) -> str | None:
+    direct = _field(response, "refusal")
     if isinstance(direct, str) and direct.strip():
         return direct.strip()
 
-    output = response_dict.get("output")
-    if not isinstance(output, list):
-        return None
-
-    for item in output:
-        if not isinstance(item, dict):
-            continue
-        if item.get("type") != "message":
+    for chunk in _message_content(response):
+        if _field(chunk, "type") != "refusal":
             continue
-        content = item.get("content")
-        if not isinstance(content, list):
-            continue
-        for chunk in content:
-            if not isinstance(chunk, dict):
-                continue
-            if chunk.get("type") != "refusal":
-                continue
-            ref = chunk.get("refusal")
-            if isinstance(ref, str) and ref.strip():
-                return ref.strip()
+        ref = _field(chunk, "refusal")
+        if isinstance(ref, str) and ref.strip():
+            return ref.strip()
     return None
 
 
-def _extract_usage(response: Any, response_dict: dict[str, Any]) -> dict[str, Any]:
-    usage = response_dict.get("usage")
-    if isinstance(usage, dict):
-        return usage
-
-    obj = getattr(response, "usage", None)
-    if hasattr(obj, "model_dump"):
-        try:
-            usage_dump = obj.model_dump(mode="python")
-            if isinstance(usage_dump, dict):
-                return usage_dump
-        except Exception:
-            return {}
-
-    if isinstance(obj, dict):
-        return obj
-    return {}
+def _extract_usage(response: Any) -> dict[str, Any]:
+    return _to_dict(_field(response, "usage"))
 
 
 IDEA_TARGET_SCHEMA: dict[str, Any] = {
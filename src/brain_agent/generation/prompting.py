@@ -11,6 +11,12 @@ from pydantic import ValidationError
 
 from ..retrieval.pack_builder import RetrievalPack
 from ..schemas import CandidateAlpha, IdeaSpec, SimulationTarget
+from ..utils.json_codec import dumps_text, loads as json_loads
+
+try:
+    import pyjson5
+except Exception:  # pragma: no cover - optional dependency
+    pyjson5 = None
 
 ParseErrorCode = Literal[
     "empty_output",
@@ -22,6 +28,71 @@ ParseErrorCode = Literal[
 
 T = TypeVar("T")
 
+_JSON_DECODER = json.JSONDecoder()
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_PYTHONISH_LITERAL_RE = re.compile(r"\b(None|True|False)\b")
+_PYTHONISH_LITERALS = {"None": "null", "True": "true", "False": "false"}
+
+
+_IDEA_BASE_RULES: tuple[str, ...] = (
+    "Return JSON only.",
+    "Follow IdeaSpec schema exactly.",
+    "Keep hypothesis as one concise sentence.",
+    "keywords_for_retrieval should be practical query tokens.",
+)
+_IDEA_OUTPUT_SCHEMA: dict[str, Any] = {
+    "idea_id": "str",
+    "hypothesis": "str",
+    "keywords_for_retrieval": ["str"],
+    "target": "SimulationTarget object",
+    "candidate_subcategories": ["str"],
+    "exploration_intent": "optional str",
+    "retrieval_context_id": "optional str",
+}
+
+_ALPHA_MAKER_BASE_RULES: tuple[str, ...] = (
+    "Return JSON only.",
+    "Follow CandidateAlpha schema exactly.",
+    "simulation_settings.type must be REGULAR.",
+    "simulation_settings.settings.language must be FASTEXPR.",
+    "Use only retrieval_pack candidate fields/operators.",
+)
+_ALPHA_MAKER_OUTPUT_SCHEMA: dict[str, Any] = {
+    "idea_id": "str",
+    "alpha_id": None,
+    "simulation_settings": {
+        "type": "REGULAR",
+        "settings": "SimulationSettings object (language=FASTEXPR)",
+        "regular": "FastExpr string",
+    },
+    "generation_notes": {
+        "used_fields": ["field id"],
+        "used_operators": ["operator name"],
+        "candidate_lane": "optional exploit|explore",
+    },
+}
+
+_FASTEXPR_BASE_RULES: tuple[str, ...] = (
+    "Return JSON only.",
+    "Follow CandidateAlpha schema exactly.",
+    "Use only provided operators and data fields.",
+    "Expression must be type=REGULAR and language=FASTEXPR.",
+)
+_FASTEXPR_OUTPUT_SCHEMA: dict[str, Any] = {
+    "idea_id": "str",
+    "alpha_id": None,
+    "simulation_settings": {
+        "type": "REGULAR",
+        "settings": "SimulationSettings object",
+        "regular": "FastExpr string",
+    },
+    "generation_notes": {
+        "used_fields": ["field id"],
+        "used_operators": ["operator name"],
+        "candidate_lane": "optional exploit|explore",
+    },
+}
+
 
 class ParseFailure(ValueError):
     """Strict parse failure with standardized stage/code metadata."""
@@ -45,20 +116,13 @@ def build_idea_researcher_prompt(
     """Build Idea Researcher prompt contract payload (JSON envelope)."""
     target_payload: dict[str, Any]
     if isinstance(target, SimulationTarget):
-        target_payload = target.model_dump(mode="python")
+        target_payload = _simulation_target_payload(target)
     elif isinstance(target, dict):
         target_payload = target
     else:
-        target_payload = SimulationTarget().model_dump(mode="python")
+        target_payload = _DEFAULT_TARGET_PAYLOAD
 
-    base_rules = [
-        "Return JSON only.",
-        "Follow IdeaSpec schema exactly.",
-        "Keep hypothesis as one concise sentence.",
-        "keywords_for_retrieval should be practical query tokens.",
-    ]
-    if rules:
-        base_rules.extend(rules)
+    base_rules = [*_IDEA_BASE_RULES, *rules] if rules else _IDEA_BASE_RULES
 
     payload = {
         "agent": "Idea Researcher",
@@ -70,17 +134,9 @@ def build_idea_researcher_prompt(
             "target": target_payload,
         },
         "rules": base_rules,
-        "output_schema": {
-            "idea_id": "str",
-            "hypothesis": "str",
-            "keywords_for_retrieval": ["str"],
-            "target": "SimulationTarget object",
-            "candidate_subcategories": ["str"],
-            "exploration_intent": "optional str",
-            "retrieval_context_id": "optional str",
-        },
+        "output_schema": _IDEA_OUTPUT_SCHEMA,
     }
-    return json.dumps(payload, ensure_ascii=False, indent=2)
+    return dumps_text(payload, indent=True)
 
 
 def build_alpha_maker_prompt(
@@ -94,15 +150,7 @@ def build_alpha_maker_prompt(
     if not retrieval_pack.context_guard.full_metadata_blocked:
         raise ValueError("Retrieval pack does not satisfy full-metadata blocking guard")
 
-    base_rules = [
-        "Return JSON only.",
-        "Follow CandidateAlpha schema exactly.",
-        "simulation_settings.type must be REGULAR.",
-        "simulation_settings.settings.language must be FASTEXPR.",
-        "Use only retrieval_pack candidate fields/operators.",
-    ]
-    if rules:
-        base_rules.extend(rules)
+    base_rules = [*_ALPHA_MAKER_BASE_RULES, *rules] if rules else _ALPHA_MAKER_BASE_RULES
 
     payload = {
         "agent": "Alpha Maker",
@@ -110,22 +158,9 @@ def build_alpha_maker_prompt(
         "retrieval_pack": _retrieval_prompt_payload(retrieval_pack),
         "knowledge_pack": knowledge_pack or {},
         "rules": base_rules,
-        "output_schema": {
-            "idea_id": "str",
-            "alpha_id": None,
-            "simulation_settings": {
-                "type": "REGULAR",
-                "settings": "SimulationSettings object (language=FASTEXPR)",
-                "regular": "FastExpr string",
-            },
-            "generation_notes": {
-                "used_fields": ["field id"],
-                "used_operators": ["operator name"],
-                "candidate_lane": "optional exploit|explore",
-            },
-        },
+        "output_schema": _ALPHA_MAKER_OUTPUT_SCHEMA,
     }
-    return json.dumps(payload, ensure_ascii=False, indent=2)
+    return dumps_text(payload, indent=True)
 
 
 def build_fastexpr_prompt(
@@ -136,36 +171,16 @@ def build_fastexpr_prompt(
     rules: list[str] | None = None,
 ) -> str:
     """Backward-compatible builder for step-16/17 call sites."""
-    base_rules = [
-        "Return JSON only.",
-        "Follow CandidateAlpha schema exactly.",
-        "Use only provided operators and data fields.",
-        "Expression must be type=REGULAR and language=FASTEXPR.",
-    ]
-    if rules:
-        base_rules.extend(rules)
+    base_rules = [*_FASTEXPR_BASE_RULES, *rules] if rules else _FASTEXPR_BASE_RULES
 
     payload = {
         "idea": idea.model_dump(mode="python"),
         "operators": operators,
         "data_fields": data_fields,
         "rules": base_rules,
-        "output_schema": {
-            "idea_id": "str",
-            "alpha_id": None,
-            "simulation_settings": {
-                "type": "REGULAR",
-                "settings": "SimulationSettings object",
-                "regular": "FastExpr string",
-            },
-            "generation_notes": {
-                "used_fields": ["field id"],
-                "used_operators": ["operator name"],
-                "candidate_lane": "optional exploit|explore",
-            },
-        },
+        "output_schema": _FASTEXPR_OUTPUT_SCHEMA,
     }
-    return json.dumps(payload, ensure_ascii=False, indent=2)
+    return dumps_text(payload, indent=True)
 
 
 def build_gated_fastexpr_prompt(
@@ -235,6 +250,14 @@ def repair_json_text(raw_text: str) -> str:
     if not str(raw_text or "").strip():
         raise ParseFailure(stage="repair", code="empty_output", detail="Model output is empty")
 
+    # Already-valid JSON (e.g. a schema failure upstream) needs no candidate ladder.
+    stripped = str(raw_text).strip()
+    try:
+        json.loads(stripped)
+        return stripped
+    except ValueError:
+        pass
+
     candidates: list[str] = []
     seen: set[str] = set()
 
@@ -274,6 +297,15 @@ def repair_json_text(raw_text: str) -> str:
         except Exception:
             continue
 
+    # JSON5 covers single quotes, unquoted keys and comments in C; literal_eval
+    # stays as the last resort (and the only one without pyjson5 installed).
+    if pyjson5 is not None:
+        for candidate in candidates:
+            try:
+                return json.dumps(pyjson5.decode(candidate), ensure_ascii=False)
+            except Exception:
+                continue
+
     for candidate in candidates:
         try:
             literal = ast.literal_eval(candidate)
@@ -299,7 +331,12 @@ def _parse_model_payload(
         raise ParseFailure(stage=stage, code="empty_output", detail="Model output is empty")
 
     try:
-        payload = json.loads(text)
+        try:
+            payload = json_loads(text)
+        except json.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which stdlib json accepts; its error
+            # also carries the msg/line/col reported below.
+            payload = json.loads(text)
     except json.JSONDecodeError as exc:
         raise ParseFailure(
             stage=stage,
@@ -325,20 +362,18 @@ def _parse_model_payload(
         ) from exc
 
 
+def _simulation_target_payload(target: SimulationTarget) -> dict[str, Any]:
+    # Same output as model_dump(mode="python") for this flat, scalar-only
+    # model, without the pydantic serializer round-trip.
+    return {name: getattr(target, name) for name in _SIMULATION_TARGET_FIELDS}
+
+
+_SIMULATION_TARGET_FIELDS = tuple(SimulationTarget.model_fields)
+_DEFAULT_TARGET_PAYLOAD = _simulation_target_payload(SimulationTarget())
+
+
 def _retrieval_prompt_payload(retrieval_pack: RetrievalPack) -> dict[str, Any]:
-    return {
-        "idea_id": retrieval_pack.idea_id,
-        "query": retrieval_pack.query,
-        "target": retrieval_pack.target.model_dump(mode="python"),
-        "selected_subcategories": retrieval_pack.selected_subcategories,
-        "candidate_datasets": [x.model_dump(mode="python") for x in retrieval_pack.candidate_datasets],
-        "candidate_fields": [x.model_dump(mode="python") for x in retrieval_pack.candidate_fields],
-        "candidate_operators": [x.model_dump(mode="python") for x in retrieval_pack.candidate_operators],
-        "lanes": {k: v.model_dump(mode="python") for k, v in retrieval_pack.lanes.items()},
-        "budget_policy": retrieval_pack.budget_policy,
-        "expansion_policy": retrieval_pack.expansion_policy,
-        "context_guard": retrieval_pack.context_guard.model_dump(mode="python"),
-    }
+    return retrieval_pack.prompt_payload()
 
 
 def _strip_markdown_fence(text: str) -> str:
@@ -369,6 +404,14 @@ def _extract_json_fragment(text: str) -> str | None:
         return None
 
     start = min(start_candidates)
+    # Well-formed fragments are delimited by the C decoder in one call; the
+    # bracket scanner below still recovers fragments that need repair.
+    try:
+        _, end = _JSON_DECODER.raw_decode(src, start)
+        return src[start:end]
+    except ValueError:
+        pass
+
     opener = src[start]
     closer = "}" if opener == "{" else "]"
 
@@ -402,11 +445,10 @@ def _extract_json_fragment(text: str) -> str | None:
 
 
 def _remove_trailing_commas(text: str) -> str:
-    return re.sub(r",\s*([}\]])", r"\1", text)
+    return _TRAILING_COMMA_RE.sub(r"\1", text)
 
 
 def _normalize_pythonish_literals(text: str) -> str:
-    out = re.sub(r"\bNone\b", "null", text)
-    out = re.sub(r"\bTrue\b", "true", out)
-    out = re.sub(r"\bFalse\b", "false", out)
-    return out
+    if "None" not in text and "True" not in text and "False" not in text:
+        return text
+    return _PYTHONISH_LITERAL_RE.sub(lambda m: _PYTHONISH_LITERALS[m.group(1)], text)
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import re
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from .prompting import parse_candidate_alpha, parse_with_format_repair
 from ..retrieval.pack_builder import RetrievalPack
 from ..schemas import CandidateAlpha, ValidationReport
+from ..utils.json_codec import dumps_text
 from ..validation.static_validator import VALIDATION_ERROR_TAXONOMY, StaticValidator
 
 
@@ -18,11 +20,49 @@ UNKNOWN_FIELD_RE = re.compile(r"Unknown data field:\s*([A-Za-z_][A-Za-z0-9_]*)")
 SCOPE_VIOLATION_RE = re.compile(r"Operator\s+([A-Za-z_][A-Za-z0-9_]*)\s+scope")
 TS_NON_MATRIX_RE = re.compile(r"received non-MATRIX field\s+([A-Za-z_][A-Za-z0-9_]*)")
 VECTOR_NON_VEC_RE = re.compile(r"VECTOR field\s+([A-Za-z_][A-Za-z0-9_]*)")
-IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
-OP_CALL_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*\(")
-
-
-@dataclass
+IDENT_CALL_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)(\s*\()?")
+NON_FIELD_KEYWORDS = frozenset({"if", "else", "and", "or", "not", "true", "false", "null"})
+UNSUPPORTED_CHAR_RE = re.compile(r"[^A-Za-z0-9_.,()\-+*/\s]")
+# ASCII deletions matching UNSUPPORTED_CHAR_RE, for str.translate on ASCII input.
+_ASCII_STRIP_TABLE = {
+    code: None for code in range(128) if UNSUPPORTED_CHAR_RE.match(chr(code))
+}
+UNKNOWN_TOKEN_ERROR_CODES = frozenset({"unknown_operator", "unknown_data_field"})
+FIELD_TYPE_ERROR_CODES = frozenset(
+    {
+        "ts_non_matrix_input",
+        "group_requires_group_and_matrix",
+        "vector_used_in_non_vec",
+    }
+)
+STRUCTURAL_ERROR_CODES = frozenset(
+    {
+        "operator_no_arguments",
+        "operator_empty_argument",
+        "operator_arity_mismatch",
+        "unbalanced_parentheses",
+    }
+)
+PREFERRED_REGULAR_OPERATORS = ("rank", "zscore", "ts_delta", "ts_mean", "ts_stddev")
+# Key order of repair instructions; build_repair_instruction overwrites every value.
+_REPAIR_TEMPLATE: dict[str, Any] = dict.fromkeys(
+    (
+        "attempt",
+        "error_codes",
+        "errors",
+        "repeated_error_count",
+        "expanded_retrieval",
+        "candidate_lane",
+        "rulebook",
+        "available_candidates",
+    )
+)
+
+
+ErrorSignature = frozenset[tuple[str, int]]
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationIssue:
     code: str
     message: str
@@ -30,11 +70,12 @@ class ValidationIssue:
     fix_hint: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationGateResult:
     report: ValidationReport
     issues: list[ValidationIssue]
-    error_signature: str
+    # Multiset of issue codes as (code, count) pairs; empty when valid.
+    error_signature: ErrorSignature
 
     @property
     def is_valid(self) -> bool:
@@ -46,33 +87,47 @@ class ValidationGate:
 
     def __init__(self, validator: StaticValidator) -> None:
         self.validator = validator
-        self._taxonomy: list[tuple[str, re.Pattern[str], str, str]] = []
+        self._taxonomy: list[tuple[str, str, str]] = []
+        alternatives: list[str] = []
         for row in VALIDATION_ERROR_TAXONOMY:
             pattern = str(row.get("match_pattern") or "")
             if not pattern:
                 continue
+            # Each row is a lookahead from the start of the message, so the
+            # first matching row in taxonomy order wins (not the leftmost hit).
+            alternatives.append(rf"(?P<t{len(self._taxonomy)}>(?=[\s\S]*?(?:{pattern})))")
             self._taxonomy.append(
                 (
                     str(row.get("error_key") or "validation_error"),
-                    re.compile(pattern),
                     str(row.get("severity") or "medium"),
                     str(row.get("fix_hint") or ""),
                 )
             )
+        self._taxonomy_re = re.compile("|".join(alternatives)) if alternatives else None
+        # Fallback synthesis re-checks the same few template expressions on
+        # every repair; the validator's metadata is fixed for the gate's life.
+        self._is_valid_regular = lru_cache(maxsize=256)(self._check_regular)
+
+        self._validator_regular_operators = tuple(
+            name for name, scopes in validator.operator_scopes.items() if _regular_scope_allowed(scopes)
+        )
+        self._validator_preferred_operator = next(
+            (name for name in PREFERRED_REGULAR_OPERATORS if name in self._validator_regular_operators),
+            None,
+        )
+        self._pack_operator_cache: tuple[list[Any], list[str]] | None = None
+        self._pack_field_cache: tuple[list[Any], dict[str, str], str | None] | None = None
 
     def validate_candidate(self, candidate: CandidateAlpha) -> ValidationGateResult:
-        expression = _candidate_expression(candidate)
-        report = self.validator.validate(expression, alpha_type=candidate.simulation_settings.type)
+        sim = candidate.simulation_settings
+        report = self.validator.validate(sim.regular or sim.combo or "", alpha_type=sim.type)
         issues = self.classify_errors(report.errors)
-        signature = "|".join(sorted(issue.code for issue in issues)) if issues else "VALID"
+        signature: ErrorSignature = frozenset(Counter(issue.code for issue in issues).items())
         return ValidationGateResult(report=report, issues=issues, error_signature=signature)
 
     def classify_errors(self, errors: list[str]) -> list[ValidationIssue]:
-        issues: list[ValidationIssue] = []
-        for message in errors:
-            mapped = self._map_error(message)
-            issues.append(mapped)
-        return issues
+        map_error = self._map_error
+        return [map_error(message) for message in errors]
 
     def build_repair_instruction(
         self,
@@ -85,21 +140,21 @@ class ValidationGate:
         expanded_retrieval: bool,
     ) -> dict[str, Any]:
         error_codes = [issue.code for issue in issues]
-        rulebook = _repair_rulebook(error_codes)
-        return {
-            "attempt": int(attempt),
-            "error_codes": error_codes,
-            "errors": [issue.message for issue in issues],
-            "repeated_error_count": int(repeated_error_count),
-            "expanded_retrieval": bool(expanded_retrieval),
-            "candidate_lane": candidate.generation_notes.candidate_lane,
-            "rulebook": rulebook,
-            "available_candidates": {
-                "fields": len(retrieval_pack.candidate_fields),
-                "operators": len(retrieval_pack.candidate_operators),
-                "subcategories": len(retrieval_pack.selected_subcategories),
-            },
+        out = _REPAIR_TEMPLATE.copy()
+        out["attempt"] = int(attempt)
+        out["error_codes"] = error_codes
+        out["errors"] = [issue.message for issue in issues]
+        out["repeated_error_count"] = int(repeated_error_count)
+        out["expanded_retrieval"] = bool(expanded_retrieval)
+        out["candidate_lane"] = candidate.generation_notes.candidate_lane
+        out["rulebook"] = _repair_rulebook(error_codes)
+        # The template copy is shallow, so the nested counts dict is fresh.
+        out["available_candidates"] = {
+            "fields": len(retrieval_pack.candidate_fields),
+            "operators": len(retrieval_pack.candidate_operators),
+            "subcategories": len(retrieval_pack.selected_subcategories),
         }
+        return out
 
     def repair_candidate(
         self,
@@ -108,8 +163,16 @@ class ValidationGate:
         issues: list[ValidationIssue],
         retrieval_pack: RetrievalPack,
     ) -> CandidateAlpha:
-        repaired = candidate.model_copy(deep=True)
-        expression = _candidate_expression(repaired)
+        # Only regular and the used_* notes are rewritten below, so copy just
+        # those two sub-models; settings and the remaining fields are shared.
+        sim = candidate.simulation_settings
+        repaired = candidate.model_copy(
+            update={
+                "simulation_settings": sim.model_copy(),
+                "generation_notes": candidate.generation_notes.model_copy(),
+            }
+        )
+        expression = sim.regular or sim.combo or ""
         codes = {issue.code for issue in issues}
         errors = [issue.message for issue in issues]
 
@@ -117,79 +180,73 @@ class ValidationGate:
             expression = self._synthesize_expression(retrieval_pack)
 
         if "unsupported_characters" in codes:
-            expression = re.sub(r"[^A-Za-z0-9_.,()\-+*/\s]", "", expression)
+            expression = _strip_unsupported_chars(expression)
 
         unknown_operators = _extract_all(UNKNOWN_OPERATOR_RE, errors)
         if unknown_operators:
             replacement = self._pick_regular_operator(retrieval_pack, exclude=set(unknown_operators))
             if replacement:
-                for unknown in unknown_operators:
-                    expression = re.sub(rf"\b{re.escape(unknown)}(?=\s*\()", replacement, expression)
+                expression = _op_call_pattern(tuple(unknown_operators)).sub(replacement, expression)
 
         scope_ops = _extract_all(SCOPE_VIOLATION_RE, errors)
         if scope_ops:
             replacement = self._pick_regular_operator(retrieval_pack, exclude=set(scope_ops))
             if replacement:
-                for op in scope_ops:
-                    expression = re.sub(rf"\b{re.escape(op)}(?=\s*\()", replacement, expression)
-
-        unknown_fields = _extract_all(UNKNOWN_FIELD_RE, errors)
-        if unknown_fields:
-            replacement = self._pick_field_id(retrieval_pack, preferred_type="MATRIX")
-            if replacement:
-                for field_id in unknown_fields:
-                    expression = _replace_identifier(expression, field_id, replacement)
-
-        ts_bad_fields = _extract_all(TS_NON_MATRIX_RE, errors)
-        if ts_bad_fields:
+                expression = _op_call_pattern(tuple(scope_ops)).sub(replacement, expression)
+
+        # Unknown, ts_-mismatched and vector-misused fields all get the same
+        # MATRIX replacement, so they are rewritten together in one pass.
+        bad_fields = [
+            *_extract_all(UNKNOWN_FIELD_RE, errors),
+            *_extract_all(TS_NON_MATRIX_RE, errors),
+            *_extract_all(VECTOR_NON_VEC_RE, errors),
+        ]
+        if bad_fields:
             matrix_field = self._pick_field_id(retrieval_pack, preferred_type="MATRIX")
             if matrix_field:
-                for field_id in ts_bad_fields:
-                    expression = _replace_identifier(expression, field_id, matrix_field)
+                expression = _replace_identifiers(expression, bad_fields, matrix_field)
 
-        vector_bad_fields = _extract_all(VECTOR_NON_VEC_RE, errors)
-        if vector_bad_fields:
-            matrix_field = self._pick_field_id(retrieval_pack, preferred_type="MATRIX")
-            if matrix_field:
-                for field_id in vector_bad_fields:
-                    expression = _replace_identifier(expression, field_id, matrix_field)
-
-        structural_codes = {
-            "operator_no_arguments",
-            "operator_empty_argument",
-            "operator_arity_mismatch",
-            "unbalanced_parentheses",
-        }
+        # Group expressions are only returned once validated; synthesized ones
+        # may be an unvalidated last resort, but their check is a cache hit.
+        known_valid = False
         if "group_requires_group_and_matrix" in codes:
-            expression = self._build_group_expression(retrieval_pack) or self._synthesize_expression(retrieval_pack)
-        elif codes.intersection(structural_codes):
+            group_expression = self._build_group_expression(retrieval_pack)
+            if group_expression:
+                expression, known_valid = group_expression, True
+            else:
+                expression = self._synthesize_expression(retrieval_pack)
+        elif not STRUCTURAL_ERROR_CODES.isdisjoint(codes):
             expression = self._synthesize_expression(retrieval_pack)
 
-        repaired.simulation_settings.regular = expression.strip()
-        repaired.generation_notes.used_fields = _infer_used_fields(expression)
-        repaired.generation_notes.used_operators = _infer_used_operators(expression)
-
+        expression = expression.strip()
         # Last-resort fallback if heuristic edits are still invalid.
-        post = self.validator.validate(repaired.simulation_settings.regular or "", alpha_type="REGULAR")
-        if not post.is_valid:
-            repaired.simulation_settings.regular = self._synthesize_expression(retrieval_pack)
-            repaired.generation_notes.used_fields = _infer_used_fields(repaired.simulation_settings.regular or "")
-            repaired.generation_notes.used_operators = _infer_used_operators(repaired.simulation_settings.regular or "")
+        if not known_valid and not self._is_valid_regular(expression):
+            expression = self._synthesize_expression(retrieval_pack)
+
+        # The schemas leave validate_assignment off, so these are plain
+        # attribute writes; each field is written exactly once.
+        repaired.simulation_settings.regular = expression
+        notes = repaired.generation_notes
+        notes.used_fields, notes.used_operators = _infer_used_tokens(expression)
         return repaired
 
     def parse_candidate_with_format_repair(self, raw_text: str) -> tuple[CandidateAlpha, bool]:
         return parse_with_format_repair(raw_text, parser=parse_candidate_alpha)
 
+    def _check_regular(self, expression: str) -> bool:
+        return self.validator.validate(expression, alpha_type="REGULAR").is_valid
+
     def _map_error(self, message: str) -> ValidationIssue:
         text = str(message or "")
-        for error_key, pattern, severity, fix_hint in self._taxonomy:
-            if pattern.search(text):
-                return ValidationIssue(
-                    code=error_key,
-                    message=text,
-                    severity=severity,
-                    fix_hint=fix_hint,
-                )
+        matched = self._taxonomy_re.match(text) if self._taxonomy_re is not None else None
+        if matched is not None and matched.lastgroup:
+            error_key, severity, fix_hint = self._taxonomy[int(matched.lastgroup[1:])]
+            return ValidationIssue(
+                code=error_key,
+                message=text,
+                severity=severity,
+                fix_hint=fix_hint,
+            )
         return ValidationIssue(
             code="validation_error",
             message=text,
@@ -217,23 +274,23 @@ class ValidationGate:
         for expr, required_ops in templates:
             if required_ops and not required_ops.issubset(operators):
                 continue
-            if self.validator.validate(expr, alpha_type="REGULAR").is_valid:
+            if self._is_valid_regular(expr):
                 return expr
 
         # Fall back to known operator universe from validator rows.
         for expr, _ in templates:
-            if self.validator.validate(expr, alpha_type="REGULAR").is_valid:
+            if self._is_valid_regular(expr):
                 return expr
 
         # Final deterministic fallback.
-        if self.validator.validate(any_field, alpha_type="REGULAR").is_valid:
+        if self._is_valid_regular(any_field):
             return any_field
 
         fallback_field = self._fallback_field_from_validator(preferred_type="MATRIX")
         if fallback_field:
-            if self.validator.validate(f"rank({fallback_field})", alpha_type="REGULAR").is_valid:
+            if self._is_valid_regular(f"rank({fallback_field})"):
                 return f"rank({fallback_field})"
-            if self.validator.validate(fallback_field, alpha_type="REGULAR").is_valid:
+            if self._is_valid_regular(fallback_field):
                 return fallback_field
         return any_field
 
@@ -253,52 +310,65 @@ class ValidationGate:
             if op not in available:
                 continue
             expr = f"{op}({matrix_field}, {group_field})"
-            if self.validator.validate(expr, alpha_type="REGULAR").is_valid:
+            if self._is_valid_regular(expr):
                 return expr
         return None
 
     def _pick_regular_operator(self, retrieval_pack: RetrievalPack, *, exclude: set[str] | None = None) -> str | None:
         exclude_set = {str(item) for item in (exclude or set())}
-        preferred = ["rank", "zscore", "ts_delta", "ts_mean", "ts_stddev"]
-        candidates: list[str] = []
-        for op in retrieval_pack.candidate_operators:
-            name = str(op.name or "")
-            if not name or name in exclude_set:
-                continue
-            scopes = {str(scope).upper() for scope in op.scope}
-            if scopes and "REGULAR" not in scopes:
-                continue
-            candidates.append(name)
+        candidates = [name for name in self._pack_regular_operators(retrieval_pack) if name not in exclude_set]
 
-        for name in preferred:
-            if name in candidates:
-                return name
         if candidates:
+            available = set(candidates)
+            for name in PREFERRED_REGULAR_OPERATORS:
+                if name in available:
+                    return name
             return candidates[0]
 
-        for name in preferred:
-            if name in self.validator.operators:
-                scope = {str(x).upper() for x in self.validator.operator_scopes.get(name, set())}
-                if not scope or "REGULAR" in scope:
-                    return name
+        if self._validator_preferred_operator:
+            return self._validator_preferred_operator
 
-        for name, scopes in self.validator.operator_scopes.items():
-            if name in exclude_set:
-                continue
-            upper = {str(x).upper() for x in scopes}
-            if not upper or "REGULAR" in upper:
-                return name
-        return None
+        return next((name for name in self._validator_regular_operators if name not in exclude_set), None)
+
+    def _pack_regular_operators(self, retrieval_pack: RetrievalPack) -> list[str]:
+        # Budget fitting swaps candidate_operators wholesale, so the list's
+        # identity is a valid cache key; the entry keeps that list alive.
+        operators = retrieval_pack.candidate_operators
+        cached = self._pack_operator_cache
+        if cached is not None and cached[0] is operators:
+            return cached[1]
+        names: list[str] = []
+        for op in operators:
+            name = str(op.name or "")
+            if name and _regular_scope_allowed(op.scope):
+                names.append(name)
+        self._pack_operator_cache = (operators, names)
+        return names
 
     def _pick_field_id(self, retrieval_pack: RetrievalPack, *, preferred_type: str | None = None) -> str | None:
+        first_by_type, first_id = self._pack_field_picks(retrieval_pack)
         if preferred_type:
-            for field in retrieval_pack.candidate_fields:
-                if str(field.type or "").upper() == preferred_type.upper():
-                    return str(field.id)
-        for field in retrieval_pack.candidate_fields:
-            return str(field.id)
+            picked = first_by_type.get(preferred_type.upper())
+            if picked is not None:
+                return picked
+        if first_id is not None:
+            return first_id
         return self._fallback_field_from_validator(preferred_type=preferred_type)
 
+    def _pack_field_picks(self, retrieval_pack: RetrievalPack) -> tuple[dict[str, str], str | None]:
+        # Same identity-keyed scheme as _pack_regular_operators: one scan per
+        # candidate_fields list yields the first field id of every type.
+        fields = retrieval_pack.candidate_fields
+        cached = self._pack_field_cache
+        if cached is not None and cached[0] is fields:
+            return cached[1], cached[2]
+        first_by_type: dict[str, str] = {}
+        for field in fields:
+            first_by_type.setdefault(str(field.type or "").upper(), str(field.id))
+        first_id = str(fields[0].id) if fields else None
+        self._pack_field_cache = (fields, first_by_type, first_id)
+        return first_by_type, first_id
+
     def _fallback_field_from_validator(self, *, preferred_type: str | None = None) -> str | None:
         if preferred_type:
             for field_id, field_type in self.validator.field_types.items():
@@ -309,77 +379,79 @@ class ValidationGate:
         return None
 
 
+def _regular_scope_allowed(scopes: Any) -> bool:
+    upper = {str(scope).upper() for scope in scopes}
+    return not upper or "REGULAR" in upper
+
+
 def _extract_all(pattern: re.Pattern[str], messages: list[str]) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
+    seen: dict[str, None] = {}
     for message in messages:
-        for matched in pattern.findall(str(message or "")):
-            value = str(matched).strip()
-            if not value or value in seen:
-                continue
-            seen.add(value)
-            out.append(value)
-    return out
+        if not isinstance(message, str):
+            message = str(message or "")
+        for matched in pattern.findall(message):
+            value = matched.strip()
+            if value:
+                seen[value] = None
+    return list(seen)
 
 
-def _replace_identifier(expression: str, source: str, target: str) -> str:
-    if not source or not target or source == target:
-        return expression
-    return re.sub(rf"\b{re.escape(source)}\b", target, expression)
+def _strip_unsupported_chars(expression: str) -> str:
+    if expression.isascii():
+        return expression.translate(_ASCII_STRIP_TABLE)
+    # Non-ASCII input keeps the regex, whose \s also allows Unicode whitespace.
+    return UNSUPPORTED_CHAR_RE.sub("", expression)
+
 
+@lru_cache(maxsize=1024)
+def _op_call_pattern(names: tuple[str, ...]) -> re.Pattern[str]:
+    alternation = "|".join(re.escape(name) for name in names)
+    return re.compile(rf"\b(?:{alternation})(?=\s*\()")
 
-def _infer_used_operators(expression: str) -> list[str]:
-    return _unique([match.group(1) for match in OP_CALL_RE.finditer(expression or "")])
 
+@lru_cache(maxsize=1024)
+def _identifier_pattern(names: tuple[str, ...]) -> re.Pattern[str]:
+    alternation = "|".join(re.escape(name) for name in names)
+    return re.compile(rf"\b(?:{alternation})\b")
 
-def _infer_used_fields(expression: str) -> list[str]:
-    operators = set(_infer_used_operators(expression))
-    blacklist = operators | {"if", "else", "and", "or", "not", "true", "false", "null"}
-    return _unique([item for item in IDENT_RE.findall(expression or "") if item not in blacklist])
+
+def _replace_identifiers(expression: str, sources: list[str], target: str) -> str:
+    names = tuple(dict.fromkeys(source for source in sources if source and source != target))
+    if not names or not target:
+        return expression
+    return _identifier_pattern(names).sub(target, expression)
 
 
-def _candidate_expression(candidate: CandidateAlpha) -> str:
-    sim = candidate.simulation_settings
-    return sim.regular or sim.combo or ""
+def _infer_used_tokens(expression: str) -> tuple[list[str], list[str]]:
+    """Return (used_fields, used_operators) from one scan of the expression."""
+    identifiers: dict[str, None] = {}
+    operators: dict[str, None] = {}
+    for match in IDENT_CALL_RE.finditer(expression or ""):
+        name = match.group(1)
+        identifiers[name] = None
+        if match.group(2):
+            operators[name] = None
+    fields = [name for name in identifiers if name not in operators and name not in NON_FIELD_KEYWORDS]
+    return fields, list(operators)
 
 
 def _repair_rulebook(error_codes: list[str]) -> list[str]:
     rules: list[str] = []
     code_set = set(error_codes)
 
-    if {"unknown_operator", "unknown_data_field"}.intersection(code_set):
+    if not UNKNOWN_TOKEN_ERROR_CODES.isdisjoint(code_set):
         rules.append("retrieval pack 후보(operator/field)로 우선 치환")
     if "operator_scope_violation" in code_set:
         rules.append("REGULAR scope 허용 연산자로 교체")
-    if {
-        "ts_non_matrix_input",
-        "group_requires_group_and_matrix",
-        "vector_used_in_non_vec",
-    }.intersection(code_set):
+    if not FIELD_TYPE_ERROR_CODES.isdisjoint(code_set):
         rules.append("ts_/group_/vec_ 타입 규칙에 맞게 필드 조합 재배치")
-    if {
-        "operator_no_arguments",
-        "operator_empty_argument",
-        "operator_arity_mismatch",
-        "unbalanced_parentheses",
-    }.intersection(code_set):
+    if not STRUCTURAL_ERROR_CODES.isdisjoint(code_set):
         rules.append("구조(괄호/인자)를 다시 생성하는 포맷 복구 우선")
     if not rules:
         rules.append("오류 메시지의 핵심 토큰을 기준으로 식을 단순화")
     return rules
 
 
-def _unique(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        out.append(value)
-    return out
-
-
 def dump_instruction_json(payload: dict[str, Any]) -> str:
     """Stable helper for logging deterministic repair instructions."""
-    return json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return dumps_text(payload, sort_keys=True)
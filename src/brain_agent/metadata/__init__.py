@@ -1,13 +1,30 @@
 """Metadata synchronization logic."""
 
-from .organize import build_metadata_indexes
-from .sync import (
-    sync_all_metadata,
-    sync_data_fields,
-    sync_datasets,
-    sync_operators,
-    sync_simulation_options,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .organize import build_metadata_indexes
+    from .sync import (
+        sync_all_metadata,
+        sync_data_fields,
+        sync_datasets,
+        sync_operators,
+        sync_simulation_options,
+    )
+
+# Submodules load on first attribute access so importing the package (or
+# metadata.organize alone) does not pull in the BRAIN API client via sync.
+_LAZY_ATTRS = {
+    "build_metadata_indexes": ".organize",
+    "sync_all_metadata": ".sync",
+    "sync_data_fields": ".sync",
+    "sync_datasets": ".sync",
+    "sync_operators": ".sync",
+    "sync_simulation_options": ".sync",
+}
 
 __all__ = [
     "build_metadata_indexes",
@@ -17,3 +34,16 @@ __all__ = [
     "sync_operators",
     "sync_simulation_options",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import re
+import string
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from ..utils.filesystem import utc_now_iso, write_json
 
+_SLUG_INVALID_RE = re.compile(r"[^a-zA-Z0-9_-]+")
+_SLUG_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
 CATEGORY_MEANINGS: dict[str, str] = {
     "analyst": "Sell-side or crowdsourced analyst estimates, ratings, and related estimate revisions.",
     "earnings": "Earnings events, surprises, and earnings estimate dynamics.",
@@ -315,8 +320,14 @@ def _hints_for_category(category_id: str) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=4096)
 def _slugify(text: str) -> str:
-    out = re.sub(r"[^a-zA-Z0-9_-]+", "-", text.strip().lower()).strip("-")
+    lowered = text.strip().lower()
+    # Taxon ids are usually slugs already; only the rest need the regex.
+    if _SLUG_CHARS.issuperset(lowered):
+        out = lowered.strip("-")
+    else:
+        out = _SLUG_INVALID_RE.sub("-", lowered).strip("-")
     return out or "unknown"
 
 
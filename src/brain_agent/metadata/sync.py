@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import partial
+import os
 from pathlib import Path
+import queue
 import sys
-from typing import Any
+import threading
+from typing import Any, BinaryIO, Callable
 
 from ..brain_api.metadata import (
     get_data_fields,
@@ -17,7 +21,8 @@ from ..brain_api.metadata import (
 from ..constants import DEFAULT_META_DIR
 from ..schemas import SimulationTarget
 from ..storage.sqlite_store import MetadataStore
-from ..utils.filesystem import utc_date, utc_now_iso, write_json
+from ..utils.filesystem import utc_date, utc_now_iso, write_json, write_json_atomic
+from ..utils.json_codec import dumps_bytes
 from .organize import build_metadata_indexes
 
 
@@ -25,6 +30,44 @@ def _dated_path(meta_dir: Path, stem: str, date_tag: str, suffix: str = "json")
     return meta_dir / f"{stem}_{date_tag}.{suffix}"
 
 
+class _CheckpointWriter:
+    """Run checkpoint file writes on a daemon thread, in submission order.
+
+    The bounded queue applies backpressure instead of dropping snapshots; the
+    first write error is re-raised from close().
+    """
+
+    def __init__(self, max_pending: int = 4) -> None:
+        self._queue: queue.Queue[Callable[[], Any] | None] = queue.Queue(maxsize=max_pending)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="brain-sync-checkpoint", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path, payload: Any) -> None:
+        self._queue.put(partial(write_json_atomic, path, payload))
+
+    def fsync(self, handle: BinaryIO) -> None:
+        handle.flush()
+        self._queue.put(partial(os.fsync, handle.fileno()))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is None:
+                try:
+                    item()
+                except BaseException as exc:  # surfaced from close()
+                    self._error = exc
+
+
 def sync_simulation_options(
     session: Any,
     store: MetadataStore,
@@ -126,6 +169,10 @@ def sync_data_fields(
     latest_path = out_dir / f"{file_stem}_latest.json"
     dated_path = _dated_path(out_dir, file_stem, date_tag)
     progress_path = out_dir / f"{file_stem}_progress.json"
+    # Checkpoint log of fetched rows, one JSON object per line; a field id seen
+    # again is appended again and the last line wins. Replaces rewriting the
+    # whole latest JSON array on every checkpoint.
+    rows_log_path = latest_path.with_suffix(".jsonl")
 
     deduped: dict[str, dict[str, Any]] = {}
     errors: list[dict[str, str]] = []
@@ -142,37 +189,44 @@ def sync_data_fields(
     current_dataset_id: str | None = None
     checkpoint_interval_pages = 5
 
-    def write_progress(*, status: str, dataset_index: int, final: bool) -> None:
-        write_json(
-            progress_path,
-            {
-                "status": status,
-                "final": final,
-                "updated_at": utc_now_iso(),
-                "target": {
-                    "instrumentType": target.instrumentType,
-                    "region": target.region,
-                    "delay": target.delay,
-                    "universe": target.universe,
-                },
-                "dataset_mode": dataset_mode,
-                "dataset_cursor": {
-                    "index": dataset_index,
-                    "total": total_datasets,
-                    "id": current_dataset_id,
-                },
-                "progress": {
-                    "pages": page_count,
-                    "raw_rows_seen": raw_count,
-                    "unique_fields": len(deduped),
-                    "page_total_hint": current_total_hint,
-                },
-                "errors": errors,
+    def progress_payload(*, status: str, dataset_index: int, final: bool) -> dict[str, Any]:
+        return {
+            "status": status,
+            "final": final,
+            "updated_at": utc_now_iso(),
+            "target": {
+                "instrumentType": target.instrumentType,
+                "region": target.region,
+                "delay": target.delay,
+                "universe": target.universe,
             },
-        )
+            "dataset_mode": dataset_mode,
+            "dataset_cursor": {
+                "index": dataset_index,
+                "total": total_datasets,
+                "id": current_dataset_id,
+            },
+            "progress": {
+                "pages": page_count,
+                "raw_rows_seen": raw_count,
+                "unique_fields": len(deduped),
+                "page_total_hint": current_total_hint,
+            },
+            "errors": list(errors),
+        }
+
+    def write_progress(*, status: str, dataset_index: int, final: bool) -> None:
+        payload = progress_payload(status=status, dataset_index=dataset_index, final=final)
+        if final:
+            write_json(progress_path, payload)
+        else:
+            # Queued behind any pending checkpoint so progress never goes backwards.
+            checkpoints.submit(progress_path, payload)
 
     def flush_checkpoint(*, dataset_index: int, force_log: bool = False) -> None:
-        write_json(latest_path, list(deduped.values()))
+        # Rows are already in the checkpoint log; the fsync and the progress
+        # snapshot run on the checkpoint thread so the next page is not blocked.
+        checkpoints.fsync(rows_log)
         write_progress(status="running", dataset_index=dataset_index, final=False)
         if force_log:
             print(
@@ -182,60 +236,76 @@ def sync_data_fields(
                 flush=True,
             )
 
-    for idx, dataset_id in enumerate(ids, start=1):
-        current_dataset_id = str(dataset_id) if dataset_id is not None else None
-        write_progress(status="running", dataset_index=idx, final=False)
-
-        def on_page(page_rows: list[dict[str, Any]], _offset: int, total_count: int) -> None:
-            nonlocal page_count, raw_count, current_total_hint
-            page_count += 1
-            raw_count += len(page_rows)
-            current_total_hint = total_count
-            for row in page_rows:
-                field_id = row.get("id")
-                if field_id:
-                    deduped[str(field_id)] = row
-            if page_rows:
-                store.upsert_data_fields(
-                    page_rows,
+    rows_log = open(rows_log_path, "wb")
+    checkpoints = _CheckpointWriter()
+    try:
+        for idx, dataset_id in enumerate(ids, start=1):
+            current_dataset_id = str(dataset_id) if dataset_id is not None else None
+            write_progress(status="running", dataset_index=idx, final=False)
+
+            def on_page(page_rows: list[dict[str, Any]], _offset: int, total_count: int) -> None:
+                nonlocal page_count, raw_count, current_total_hint
+                page_count += 1
+                raw_count += len(page_rows)
+                current_total_hint = total_count
+                logged: list[bytes] = []
+                for row in page_rows:
+                    field_id = row.get("id")
+                    if field_id:
+                        deduped[str(field_id)] = row
+                        logged.append(dumps_bytes(row))
+                if logged:
+                    logged.append(b"")
+                    rows_log.write(b"\n".join(logged))
+                if page_rows:
+                    store.upsert_data_fields(
+                        page_rows,
+                        region=target.region,
+                        delay=target.delay,
+                        universe=target.universe,
+                        fetched_at=utc_now_iso(),
+                    )
+                if page_count == 1 or page_count % checkpoint_interval_pages == 0:
+                    flush_checkpoint(dataset_index=idx, force_log=True)
+
+            try:
+                get_data_fields(
+                    session,
+                    instrument_type=target.instrumentType,
                     region=target.region,
                     delay=target.delay,
                     universe=target.universe,
-                    fetched_at=utc_now_iso(),
+                    dataset_id=dataset_id,
+                    field_type=field_type,
+                    search=search,
+                    wait_on_rate_limit=wait_on_rate_limit,
+                    on_page=on_page,
+                    collect_results=False,
                 )
-            if page_count == 1 or page_count % checkpoint_interval_pages == 0:
+            except KeyboardInterrupt:
                 flush_checkpoint(dataset_index=idx, force_log=True)
-
+                # Rows are replaced, never mutated, so a shallow copy is a stable snapshot.
+                checkpoints.submit(latest_path, list(deduped.values()))
+                write_progress(status="interrupted", dataset_index=idx, final=False)
+                raise
+            except Exception as exc:
+                errors.append(
+                    {
+                        "dataset_id": str(dataset_id),
+                        "error": str(exc),
+                    }
+                )
+                flush_checkpoint(dataset_index=idx, force_log=True)
+                # 429 is usually account/API throttling. Keep already fetched data and stop early.
+                if "429" in str(exc):
+                    break
+                continue
+    finally:
+        # Drain pending checkpoints before the final synchronous writes.
         try:
-            get_data_fields(
-                session,
-                instrument_type=target.instrumentType,
-                region=target.region,
-                delay=target.delay,
-                universe=target.universe,
-                dataset_id=dataset_id,
-                field_type=field_type,
-                search=search,
-                wait_on_rate_limit=wait_on_rate_limit,
-                on_page=on_page,
-                collect_results=False,
-            )
-        except KeyboardInterrupt:
-            flush_checkpoint(dataset_index=idx, force_log=True)
-            write_progress(status="interrupted", dataset_index=idx, final=False)
-            raise
-        except Exception as exc:
-            errors.append(
-                {
-                    "dataset_id": str(dataset_id),
-                    "error": str(exc),
-                }
-            )
-            flush_checkpoint(dataset_index=idx, force_log=True)
-            # 429 is usually account/API throttling. Keep already fetched data and stop early.
-            if "429" in str(exc):
-                break
-            continue
+            checkpoints.close()
+        finally:
+            rows_log.close()
 
     out = list(deduped.values())
 
@@ -247,6 +317,8 @@ def sync_data_fields(
         write_progress(status="partial_error", dataset_index=total_datasets, final=True)
     else:
         write_progress(status="completed", dataset_index=total_datasets, final=True)
+    # The latest JSON array now holds everything the checkpoint log did.
+    rows_log_path.unlink(missing_ok=True)
     return out, errors
 
 
@@ -5,11 +5,13 @@ from __future__ import annotations
 import json
 import math
 import re
+import sys
 import time
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field, PrivateAttr
 
 from ..constants import DEFAULT_META_DIR
 from ..schemas import IdeaSpec, SimulationTarget
@@ -20,6 +22,12 @@ from .keyword import KeywordRetriever
 TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
 ALLOWED_FIELD_TYPES = {"MATRIX", "GROUP", "VECTOR"}
 
+# Lane tags are interned at parse time so lane comparisons in hot loops
+# (budget fallback, lane partitioning) hit CPython's identity fast path.
+LANE_EXPLOIT = sys.intern("exploit")
+LANE_EXPLORE = sys.intern("explore")
+CandidateLane = Annotated[Literal["exploit", "explore"], AfterValidator(sys.intern)]
+
 
 class RetrievalLaneBudget(BaseModel):
     subcategories: int = 4
@@ -49,7 +57,42 @@ class RetrievalBudgetConfig(BaseModel):
     expansion_policy: RetrievalExpansionPolicy = Field(default_factory=RetrievalExpansionPolicy)
 
 
-class LaneSelection(BaseModel):
+_DUMP_CACHE_ATTRS = ("cached_dump", "cached_json_len")
+
+
+class _DumpCachedModel(BaseModel):
+    """Pack row whose python dump and JSON length are computed once.
+
+    The cached values live in the instance __dict__, so they are dropped on
+    attribute assignment and on model_copy (which would otherwise carry them
+    over to the copy). In-place mutation of a nested list is not detected.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._drop_dump_cache()
+        super().__setattr__(name, value)
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Any:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._drop_dump_cache()
+        return copied
+
+    def _drop_dump_cache(self) -> None:
+        for attr in _DUMP_CACHE_ATTRS:
+            self.__dict__.pop(attr, None)
+
+    @cached_property
+    def cached_dump(self) -> dict[str, Any]:
+        """Shared python dump of the row; callers must treat it as read-only."""
+        return self.model_dump(mode="python")
+
+    @cached_property
+    def cached_json_len(self) -> int:
+        """Character length of the row under json.dumps(..., ensure_ascii=False)."""
+        return len(json.dumps(self.cached_dump, ensure_ascii=False))
+
+
+class LaneSelection(_DumpCachedModel):
     field_ids: list[str] = Field(default_factory=list)
     operator_names: list[str] = Field(default_factory=list)
 
@@ -76,28 +119,28 @@ class VisualGraph(BaseModel):
     edges: list[VisualGraphEdge] = Field(default_factory=list)
 
 
-class DatasetCandidate(BaseModel):
+class DatasetCandidate(_DumpCachedModel):
     id: str
     name: str
     subcategory_id: str
-    lane: Literal["exploit", "explore"]
+    lane: CandidateLane
     score: float
 
 
-class FieldCandidate(BaseModel):
+class FieldCandidate(_DumpCachedModel):
     id: str
     dataset_id: str
     type: str
-    lane: Literal["exploit", "explore"]
+    lane: CandidateLane
     score: float
 
 
-class OperatorCandidate(BaseModel):
+class OperatorCandidate(_DumpCachedModel):
     name: str
     definition: str | None = None
     scope: list[str] = Field(default_factory=list)
     category: str | None = None
-    lane: Literal["exploit", "explore"]
+    lane: CandidateLane
     score: float
 
 
@@ -133,6 +176,51 @@ class RetrievalPack(BaseModel):
     context_guard: RetrievalContextGuard
     telemetry: RetrievalTelemetry
 
+    _prompt_payload_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = PrivateAttr(default=None)
+
+    def prompt_payload(self) -> dict[str, Any]:
+        """Return the LLM-facing dump of this pack, reused until a section is reassigned.
+
+        Budget fitting replaces whole lists/dicts rather than editing them in
+        place, so an identity check on the inputs is enough to detect changes.
+        """
+        guard = self.context_guard
+        sources = (
+            self.idea_id,
+            self.query,
+            self.target,
+            self.selected_subcategories,
+            self.candidate_datasets,
+            self.candidate_fields,
+            self.candidate_operators,
+            self.lanes,
+            self.budget_policy,
+            self.expansion_policy,
+            guard,
+            guard.full_metadata_blocked,
+            guard.rules,
+            guard.max_items,
+        )
+        cached = self._prompt_payload_cache
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+
+        payload = {
+            "idea_id": self.idea_id,
+            "query": self.query,
+            "target": self.target.model_dump(mode="python"),
+            "selected_subcategories": self.selected_subcategories,
+            "candidate_datasets": [x.cached_dump for x in self.candidate_datasets],
+            "candidate_fields": [x.cached_dump for x in self.candidate_fields],
+            "candidate_operators": [x.cached_dump for x in self.candidate_operators],
+            "lanes": {k: v.cached_dump for k, v in self.lanes.items()},
+            "budget_policy": self.budget_policy,
+            "expansion_policy": self.expansion_policy,
+            "context_guard": guard.model_dump(mode="python"),
+        }
+        self._prompt_payload_cache = (sources, payload)
+        return payload
+
 
 class RetrievalPackBuilder:
     """Create bounded retrieval packs from local metadata store."""
@@ -232,9 +320,9 @@ class RetrievalPackBuilder:
                 "query": query,
                 "target": idea.target.model_dump(mode="python"),
                 "selected_subcategories": selected_subcategories,
-                "candidate_datasets": [x.model_dump(mode="python") for x in candidate_datasets],
-                "candidate_fields": [x.model_dump(mode="python") for x in candidate_fields],
-                "candidate_operators": [x.model_dump(mode="python") for x in candidate_operators],
+                "candidate_datasets": [x.cached_dump for x in candidate_datasets],
+                "candidate_fields": [x.cached_dump for x in candidate_fields],
+                "candidate_operators": [x.cached_dump for x in candidate_operators],
                 "context_guard": guard.model_dump(mode="python"),
             }
         )
@@ -425,6 +425,21 @@ class MetadataStore:
             rows = conn.execute("SELECT * FROM data_fields").fetchall()
         return [dict(row) for row in rows]
 
+    def load_knowledge_pack_inputs(
+        self,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+        """Return (operators, data_fields, datasets) read from one connection snapshot."""
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            operators = conn.execute("SELECT * FROM operators").fetchall()
+            fields = conn.execute("SELECT * FROM data_fields").fetchall()
+            datasets = conn.execute("SELECT * FROM datasets").fetchall()
+        return (
+            [dict(row) for row in operators],
+            [dict(row) for row in fields],
+            [dict(row) for row in datasets],
+        )
+
 
 def _as_int(value: Any) -> int | None:
     if value is None:
@@ -2,21 +2,46 @@
 
 from __future__ import annotations
 
-import json
+import os
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .json_codec import dumps_bytes
+
 
 def ensure_parent(path: Path) -> None:
     """Create parent directories if needed."""
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def write_bytes(path: Path, data: bytes) -> None:
+    """Write an already-encoded payload in a single write call."""
+    ensure_parent(path)
+    path.write_bytes(data)
+
+
 def write_json(path: Path, payload: Any) -> None:
     """Write JSON with UTF-8 and stable formatting."""
+    write_bytes(path, dumps_bytes(payload, indent=True))
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Write JSON via a sibling temp file so readers never see a partial file."""
     ensure_parent(path)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    data = dumps_bytes(payload, indent=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def utc_now_iso() -> str:
@@ -0,0 +1,44 @@
+"""JSON encode/decode helpers with optional orjson acceleration."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps_bytes(payload: Any, *, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Serialize payload to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            # orjson rejects a few inputs stdlib accepts (e.g. ints > 64 bit).
+            pass
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        indent=2 if indent else None,
+    ).encode("utf-8")
+
+
+def dumps_text(payload: Any, *, sort_keys: bool = False, indent: bool = False) -> str:
+    """Serialize payload to a JSON string (orjson when available)."""
+    return dumps_bytes(payload, sort_keys=sort_keys, indent=indent).decode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
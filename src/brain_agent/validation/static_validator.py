@@ -111,6 +111,7 @@ class StaticValidator:
         self.safe_regular_only = safe_regular_only
 
         self.operator_scopes = {name: _parse_scope(row.get("scope")) for name, row in self.operators.items()}
+        self._upper_scopes = {name: {s.upper() for s in scopes} for name, scopes in self.operator_scopes.items()}
         self.operator_arity = {name: _extract_arity(row) for name, row in self.operators.items()}
         self.field_types = {field_id: str(row.get("type", "")).upper() for field_id, row in self.fields.items()}
 
@@ -129,6 +130,7 @@ class StaticValidator:
 
         calls = _extract_calls(expression)
         used_operators = _unique([call.name for call in calls])
+        is_regular = alpha_type.upper() == "REGULAR"
 
         # Function/operator checks
         for call in calls:
@@ -148,13 +150,12 @@ class StaticValidator:
                     f"Operator {call.name} expects {expected_arity} args but got {len(call.args)}"
                 )
 
-            scopes = self.operator_scopes.get(call.name, set())
-            if scopes:
-                upper_scopes = {s.upper() for s in scopes}
-                if alpha_type.upper() == "REGULAR" and "REGULAR" not in upper_scopes:
+            upper_scopes = self._upper_scopes.get(call.name)
+            if upper_scopes:
+                if is_regular and "REGULAR" not in upper_scopes:
                     errors.append(f"Operator {call.name} scope {sorted(upper_scopes)} is not valid in REGULAR")
             else:
-                if self.safe_regular_only and alpha_type.upper() != "REGULAR":
+                if self.safe_regular_only and not is_regular:
                     errors.append(f"Operator {call.name} has unknown scope and is blocked in non-REGULAR mode")
 
         # Field existence checks.